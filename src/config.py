@@ -148,6 +148,7 @@ class Config:
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize configuration from YAML file."""
         self.config_path = Path(config_path)
+        self._vault_path: Path | None = None
         self._raw_config = self._load_config()
         self._expand_paths()
         self._secrets_manager = SecretsManager(config=self._raw_config)
@@ -302,11 +303,11 @@ class Config:
         return value
 
     def get_obsidian_vault_path(self) -> Path:
-        """Get the Obsidian vault path."""
-        path_str = self.get("obsidian.vault_path", "")
-        if path_str:
-            return Path(path_str).expanduser()
-        return Path("")
+        """Get the Obsidian vault path (cached after the first lookup)."""
+        if self._vault_path is None:
+            path_str = self.get("obsidian.vault_path", "")
+            self._vault_path = Path(path_str).expanduser() if path_str else Path("")
+        return self._vault_path
 
     def get_sync_folder_path(self) -> Path:
         """Get the sync folder path within the vault."""
@@ -372,6 +373,7 @@ class Config:
         return self.get(
             "processing.ocr",
             {
+                "engine": "tesseract",
                 "language": "eng",
                 "confidence_threshold": 60,
             },
@@ -395,6 +397,7 @@ class Config:
         return self.get(
             "processing.ocr",
             {
+                "engine": "tesseract",
                 "language": "eng",
                 "confidence_threshold": 60,
             },
@@ -499,8 +502,9 @@ class Config:
                 self._raw_config
             )
 
-            # Update the raw config
+            # Update the raw config and drop paths derived from the old one
             self._raw_config = migrated_config
+            self._vault_path = None
 
             # Re-parse the configuration
             self._config = self._validate_and_parse_config()
@@ -14,6 +14,10 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Bracketed labels used by KindleSyncError.__str__, computed once at import
+_SEVERITY_LABELS = {severity: severity.value.upper() for severity in ErrorSeverity}
+
+
 @dataclass
 class KindleSyncError(Exception):
     """Base exception for Kindle Sync application."""
@@ -25,7 +29,7 @@ class KindleSyncError(Exception):
     retry_count: int = 0
 
     def __str__(self) -> str:
-        return f"[{self.severity.value.upper()}] {self.message}"
+        return f"[{_SEVERITY_LABELS[self.severity]}] {self.message}"
 
 
 class FileProcessingError(KindleSyncError):
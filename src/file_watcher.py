@@ -1,5 +1,7 @@
 """File watcher for monitoring Obsidian vault changes."""
 
+import os
+import threading
 import time
 from collections.abc import Callable
 
@@ -10,6 +12,8 @@ from watchdog.observers import Observer
 
 from .config import Config
 
+_SIZE_UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
 
 class ObsidianFileHandler(FileSystemEventHandler):
     """Handler for Obsidian file system events."""
@@ -20,7 +24,17 @@ class ObsidianFileHandler(FileSystemEventHandler):
         self.callback = callback
         self.processed_files: set[Path] = set()
         self.debounce_time = config.get("advanced.debounce_time", 2.0)
-        self.pending_files: dict = {}
+        self.pending_files: dict[Path, float] = {}
+        # Pending files whose next run is the leading one for an edit burst
+        self._leading_files: set[Path] = set()
+        self._last_processed: dict[Path, float] = {}
+        # (mtime_ns, size) of each file when it was last handed to the callback
+        self._processed_signatures: dict[Path, tuple[int, int]] = {}
+
+        # One worker drains pending_files; it is started on the first event
+        self._pending_cv = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._stopping = False
 
         # Get file patterns
         self.markdown_pattern = config.get("patterns.markdown_files", "*.md")
@@ -57,59 +71,148 @@ class ObsidianFileHandler(FileSystemEventHandler):
     def _parse_size(self, size_str: str) -> int:
         """Parse size string to bytes."""
         size_str = size_str.upper()
-        if size_str.endswith("KB"):
-            return int(size_str[:-2]) * 1024
-        elif size_str.endswith("MB"):
-            return int(size_str[:-2]) * 1024 * 1024
-        elif size_str.endswith("GB"):
-            return int(size_str[:-2]) * 1024 * 1024 * 1024
-        else:
+        multiplier = _SIZE_UNITS.get(size_str[-2:])
+        if multiplier is None:
             return int(size_str)
+        return int(size_str[:-2]) * multiplier
 
     def _schedule_processing(self, file_path: Path):
-        """Schedule file processing with debouncing."""
-        # Cancel previous processing if file was modified again
-        if file_path in self.pending_files:
-            self.pending_files[file_path].cancel()
-
-        # Schedule new processing
-        import threading
-
-        timer = threading.Timer(
-            self.debounce_time, self._process_file, args=[file_path]
+        """Schedule file processing with debouncing.
+
+        The first event for a quiet file is due at once; events that follow
+        within the debounce window are coalesced into one trailing run. Files
+        are always processed on the worker, never the observer thread.
+        """
+        now = time.monotonic()
+        with self._pending_cv:
+            last_processed = self._last_processed.get(file_path)
+            leading = file_path in self._leading_files or (
+                file_path not in self.pending_files
+                and (
+                    last_processed is None or now - last_processed >= self.debounce_time
+                )
+            )
+            if leading:
+                self._leading_files.add(file_path)
+            # A repeat event just pushes the file's deadline back
+            self.pending_files[file_path] = now if leading else now + self.debounce_time
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._debounce_loop,
+                    name="obsidian-debounce",
+                    daemon=True,
+                )
+                self._worker.start()
+            self._pending_cv.notify()
+
+        logger.debug(
+            f"Scheduled processing for {file_path} in "
+            f"{0 if leading else self.debounce_time}s"
         )
-        timer.start()
-        self.pending_files[file_path] = timer
 
-        logger.debug(f"Scheduled processing for {file_path} in {self.debounce_time}s")
+    def _debounce_loop(self):
+        """Process pending files once their debounce deadline has passed."""
+        while True:
+            with self._pending_cv:
+                while True:
+                    if self._stopping:
+                        return
+                    now = time.monotonic()
+                    due = [
+                        path
+                        for path, deadline in self.pending_files.items()
+                        if deadline <= now
+                    ]
+                    if due:
+                        break
+                    timeout = (
+                        min(self.pending_files.values()) - now
+                        if self.pending_files
+                        else None
+                    )
+                    self._pending_cv.wait(timeout)
+
+                due = [(path, path in self._leading_files) for path in due]
+                for path, _ in due:
+                    del self.pending_files[path]
+                    self._leading_files.discard(path)
+
+            for path, leading in due:
+                self._process_file(path, leading=leading)
 
-    def _process_file(self, file_path: Path):
-        """Process a file after debounce period."""
+    def stop(self):
+        """Drop pending files and stop the debounce worker."""
+        with self._pending_cv:
+            self._stopping = True
+            self.pending_files.clear()
+            self._leading_files.clear()
+            self._pending_cv.notify()
+            worker = self._worker
+
+        if worker is not None:
+            worker.join()
+
+        with self._pending_cv:
+            self._worker = None
+            self._stopping = False
+
+    def _process_file(self, file_path: Path, leading: bool = False):
+        """Process a file after debounce period.
+
+        A leading run skips the recently-modified check; the trailing run for
+        the same burst picks up anything written after it.
+        """
         try:
-            # Remove from pending
-            if file_path in self.pending_files:
-                del self.pending_files[file_path]
-
             # Check if file still exists and is recent
             if not file_path.exists():
                 logger.debug(f"File no longer exists: {file_path}")
+                with self._pending_cv:
+                    self._last_processed.pop(file_path, None)
+                    self._processed_signatures.pop(file_path, None)
                 return
 
-            # Check if file was recently modified
-            current_time = time.time()
-            file_mtime = file_path.stat().st_mtime
-            if current_time - file_mtime < self.debounce_time:
+            # Check if file was recently modified; if so, look again once it
+            # has been quiet for the debounce time
+            stat = file_path.stat()
+            age = time.time() - stat.st_mtime
+            if not leading and age < self.debounce_time:
                 logger.debug(f"File still being modified: {file_path}")
+                self._defer(
+                    file_path, min(self.debounce_time - age, self.debounce_time)
+                )
                 return
 
-            # Process the file
-            logger.info(f"Processing file: {file_path}")
-            self.callback(file_path)
-            self.processed_files.add(file_path)
+            # Events that merely echo the last run (created + modified for one
+            # save) must not convert and send the file twice
+            signature = (stat.st_mtime_ns, stat.st_size)
+            with self._pending_cv:
+                unchanged = self._processed_signatures.get(file_path) == signature
+            if unchanged:
+                logger.debug(f"File unchanged since last processed: {file_path}")
+                return
+
+            self._run_callback(file_path, signature)
 
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {e}")
 
+    def _defer(self, file_path: Path, delay: float):
+        """Put a file back in the queue, keeping any later deadline."""
+        deadline = time.monotonic() + delay
+        with self._pending_cv:
+            self.pending_files[file_path] = max(
+                self.pending_files.get(file_path, deadline), deadline
+            )
+
+    def _run_callback(self, file_path: Path, signature: tuple[int, int]):
+        """Hand a file to the callback and record when and in what state."""
+        logger.info(f"Processing file: {file_path}")
+        with self._pending_cv:
+            self._last_processed[file_path] = time.monotonic()
+            self._processed_signatures[file_path] = signature
+        self.callback(file_path)
+        self.processed_files.add(file_path)
+
     def on_modified(self, event):
         """Handle file modification events."""
         if event.is_directory:
@@ -163,6 +266,15 @@ class ObsidianFileWatcher:
         self.debounce_time = config.get("advanced.debounce_time", 2.0)
         self.pending_files: dict = {}
 
+        # Suffixes from the "*.ext" patterns, resolved once for event filtering
+        self._supported_suffixes = frozenset(
+            pattern.lstrip("*").lower()
+            for pattern in (
+                config.get("patterns.markdown_files", "*.md"),
+                config.get("patterns.pdf_files", "*.pdf"),
+            )
+        )
+
         logger.info("Obsidian file watcher initialized")
 
     def start(self):
@@ -206,6 +318,7 @@ class ObsidianFileWatcher:
         try:
             self.observer.stop()
             self.observer.join()
+            self.handler.stop()
             self.is_running = False
             logger.info("Stopped watching Obsidian vault")
         except Exception as e:
@@ -224,12 +337,12 @@ class ObsidianFileWatcher:
         watched_paths = set()
         if self.observer and hasattr(self.observer, "watches"):
             for watch in self.observer.watches:
-                watched_paths.add(str(Path(watch.path)))
+                watched_paths.add(os.fspath(Path(watch.path)))
 
         # Always include the vault path
         vault_path = self.config.get_obsidian_vault_path()
         if vault_path:
-            watched_paths.add(str(vault_path))
+            watched_paths.add(os.fspath(vault_path))
 
         return list(watched_paths)
 
@@ -278,8 +391,6 @@ class ObsidianFileWatcher:
             self.pending_files[file_path].cancel()
 
         # Schedule new processing
-        import threading
-
         timer = threading.Timer(
             self.debounce_time, self._process_file, args=[file_path]
         )
@@ -309,8 +420,7 @@ class ObsidianFileWatcher:
 
     def _is_supported_file_type(self, filename: str) -> bool:
         """Check if file type is supported."""
-        filename_lower = filename.lower()
-        return filename_lower.endswith(".md") or filename_lower.endswith(".pdf")
+        return Path(filename).suffix.lower() in self._supported_suffixes
 
     def set_file_processor(self, processor):
         """Set the file processor."""
@@ -14,6 +14,13 @@ from .core.exceptions import EmailServiceError, ErrorSeverity, FileProcessingErr
 from .core.retry import retry_on_file_error, retry_on_network_error
 from .security.validation import FileValidationRequest, FileValidator
 
+# Where a USB-mounted Kindle exposes its documents, in lookup order
+_DEFAULT_KINDLE_PATHS = (
+    Path("/media/Kindle/documents"),  # Linux
+    Path("D:/documents"),  # Windows
+    Path("/Volumes/Kindle/documents"),  # macOS
+)
+
 
 class KindleSync:
     """Handle synchronization with Kindle Scribe."""
@@ -106,6 +113,13 @@ class KindleSync:
                 severity=ErrorSeverity.HIGH,
             )
 
+    def _default_kindle_path(self) -> Path:
+        """Return the first mounted default Kindle path, else the last one."""
+        for path in _DEFAULT_KINDLE_PATHS:
+            if path.exists():
+                return path
+        return _DEFAULT_KINDLE_PATHS[-1]
+
     def copy_to_kindle_usb(
         self, pdf_path: Path, kindle_path: Path | None = None
     ) -> bool:
@@ -117,11 +131,7 @@ class KindleSync:
 
             # Default Kindle documents path
             if kindle_path is None:
-                kindle_path = Path("/media/Kindle/documents")  # Linux
-                if not kindle_path.exists():
-                    kindle_path = Path("D:/documents")  # Windows
-                if not kindle_path.exists():
-                    kindle_path = Path("/Volumes/Kindle/documents")  # macOS
+                kindle_path = self._default_kindle_path()
 
             if not kindle_path.exists():
                 logger.error(f"Kindle documents folder not found: {kindle_path}")
@@ -189,11 +199,7 @@ class KindleSync:
         """Get list of documents from Kindle."""
         try:
             if kindle_path is None:
-                kindle_path = Path("/media/Kindle/documents")  # Linux
-                if not kindle_path.exists():
-                    kindle_path = Path("D:/documents")  # Windows
-                if not kindle_path.exists():
-                    kindle_path = Path("/Volumes/Kindle/documents")  # macOS
+                kindle_path = self._default_kindle_path()
 
             if not kindle_path.exists():
                 logger.warning(f"Kindle documents folder not found: {kindle_path}")
@@ -1,5 +1,14 @@
 """PDF conversion utilities for Kindle Scribe optimization."""
 
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache, partial
 from typing import Any
 
 import markdown
@@ -10,10 +19,194 @@ from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+from weasyprint.text.fonts import FontConfiguration
 
 from .config import Config
 from .core.exceptions import ErrorSeverity, FileProcessingError
 
+# Pages with fewer non-whitespace characters than this in their embedded
+# text layer are treated as scanned and sent through OCR
+_MIN_TEXT_LAYER_CHARS = 20
+
+
+def _has_text_layer(page_text: str) -> bool:
+    """Check whether a page's embedded text is substantial enough to use."""
+    return sum(not char.isspace() for char in page_text) >= _MIN_TEXT_LAYER_CHARS
+
+
+# Parallel OCR runs currently holding OMP_THREAD_LIMIT at 1, and the value
+# to restore once the last of them finishes
+_omp_limit_lock = threading.Lock()
+_omp_limit_users = 0
+_omp_limit_saved: str | None = None
+
+
+@contextmanager
+def _single_threaded_tesseract():
+    """Keep tesseract's own OpenMP threads at one while pages run in parallel.
+
+    The environment is restored when the last overlapping run ends, and a
+    limit the user set is left alone.
+    """
+    global _omp_limit_users, _omp_limit_saved
+    with _omp_limit_lock:
+        if _omp_limit_users == 0:
+            _omp_limit_saved = os.environ.get("OMP_THREAD_LIMIT")
+            if _omp_limit_saved is None:
+                os.environ["OMP_THREAD_LIMIT"] = "1"
+        _omp_limit_users += 1
+    try:
+        yield
+    finally:
+        with _omp_limit_lock:
+            _omp_limit_users -= 1
+            if _omp_limit_users == 0 and _omp_limit_saved is None:
+                os.environ.pop("OMP_THREAD_LIMIT", None)
+
+
+# Decoded images kept per converter before the cache is dropped
+_IMAGE_CACHE_MAX_ENTRIES = 256
+
+# Rendered HTML kept per converter, least recently used evicted first
+_HTML_CACHE_MAX_ENTRIES = 16
+
+
+# Markdown files at least this large are read through a memory map
+_MMAP_READ_THRESHOLD = 1024 * 1024
+
+
+def _read_markdown(path: Path) -> str:
+    """Read a UTF-8 markdown file.
+
+    Large files are decoded straight from a memory map, skipping the extra
+    copy through Python's file buffers. Line endings are left as-is there;
+    markdown normalizes them itself.
+    """
+    if path.stat().st_size < _MMAP_READ_THRESHOLD:
+        return path.read_text(encoding="utf-8")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return str(mm, "utf-8")
+
+
+# Styling for generated PDFs, apart from the per-layout @page rule
+_PDF_CSS = """\
+body {
+    font-family: 'Times New Roman', serif;
+    line-height: 1.6;
+    margin: 0;
+    padding: 20px;
+}
+h1, h2, h3, h4, h5, h6 {
+    color: #333;
+    margin-top: 1.5em;
+    margin-bottom: 0.5em;
+}
+h1 { font-size: 1.8em; }
+h2 { font-size: 1.5em; }
+h3 { font-size: 1.3em; }
+p {
+    margin-bottom: 1em;
+    text-align: justify;
+}
+code {
+    background-color: #f4f4f4;
+    padding: 2px 4px;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+}
+pre {
+    background-color: #f4f4f4;
+    padding: 10px;
+    border-radius: 5px;
+    overflow-x: auto;
+}
+blockquote {
+    border-left: 4px solid #ddd;
+    margin: 0;
+    padding-left: 20px;
+    color: #666;
+}
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 1em 0;
+}
+th, td {
+    border: 1px solid #ddd;
+    padding: 8px;
+    text-align: left;
+}
+th {
+    background-color: #f2f2f2;
+}
+"""
+
+
+@lru_cache(maxsize=32)
+def _build_stylesheet(page_size: str, margins: tuple[float, ...]) -> weasyprint.CSS:
+    """Parse the PDF stylesheet once per page size and margins (in points)."""
+    margin = " ".join(f"{side}pt" for side in margins)
+    return weasyprint.CSS(
+        string=f"@page {{ size: {page_size}; margin: {margin}; }}\n{_PDF_CSS}"
+    )
+
+
+# PaddleOCR names languages differently from tesseract
+_PADDLE_LANGUAGES = {"eng": "en", "deu": "german", "fra": "french", "spa": "es"}
+
+
+@lru_cache(maxsize=None)
+def _paddle_ocr(language: str):
+    """Load a PaddleOCR model once per process and language.
+
+    Written against the PaddleOCR 2.x API; 3.x rejects these arguments and
+    returns results in a different shape, so install ``paddleocr<3``.
+    """
+    from paddleocr import PaddleOCR
+
+    return PaddleOCR(
+        use_angle_cls=False,
+        lang=_PADDLE_LANGUAGES.get(language, language),
+        show_log=False,
+    )
+
+
+def _paddle_pages(images: list, lang: str) -> list[str]:
+    """OCR page image files with PaddleOCR, one at a time."""
+    ocr = _paddle_ocr(lang)
+    texts = []
+    for image in images:
+        result = ocr.ocr(str(image), cls=False)
+        # One entry per detected line: [box, (text, confidence)]; None if empty
+        texts.append("\n".join(line[1][0] for page in result if page for line in page))
+    return texts
+
+
+def _tesseract_pages(
+    image_to_string: Callable[..., str], images: list, lang: str
+) -> list[str]:
+    """OCR page image files with a single tesseract run.
+
+    Tesseract takes a text file listing image paths as one multi-page input
+    and ends each page's text with a form feed.
+    """
+    if len(images) == 1:
+        source = images[0]
+    else:
+        list_file = Path(images[0]).with_suffix(".txt")
+        list_file.write_text("".join(f"{image}\n" for image in images))
+        source = str(list_file)
+    pages = image_to_string(
+        source,
+        lang=lang,
+        config="--psm 6",  # Assume uniform block of text
+    ).split("\f")
+    if len(pages) < len(images):
+        raise ValueError(
+            f"tesseract returned {len(pages)} pages for {len(images)} images"
+        )
+    return pages[: len(images)]
+
 
 class MarkdownToPDFConverter:
     """Convert Markdown files to Kindle-optimized PDFs."""
@@ -37,6 +230,29 @@ class MarkdownToPDFConverter:
         # Set up styles
         self.styles = self._setup_styles()
 
+        # Reused across conversions so WeasyPrint loads fonts and images once
+        # and parses the stylesheet once per page layout
+        self._font_config = FontConfiguration()
+        self._stylesheet = _build_stylesheet(
+            "A4" if self.page_size is A4 else "letter", tuple(margins)
+        )
+        # In memory and per converter: a cache folder is wrapped in a fresh
+        # DiskCache on every write_pdf and deleted afterwards
+        self._image_cache: dict = {}
+
+        # One engine for every conversion, so extensions are loaded once;
+        # Markdown instances keep parse state, hence the lock
+        self._md = markdown.Markdown(
+            extensions=self.markdown_config.get(
+                "extensions", ["tables", "fenced_code", "toc"]
+            )
+        )
+        self._md_lock = threading.Lock()
+
+        # Rendered HTML per source text, so re-exporting an unchanged note
+        # skips the markdown parse; guarded by _md_lock
+        self._html_cache: OrderedDict[str, str] = OrderedDict()
+
         logger.info("PDF converter initialized")
 
     def _setup_styles(self) -> dict[str, ParagraphStyle]:
@@ -118,8 +334,7 @@ class MarkdownToPDFConverter:
                 )
 
             # Read markdown content
-            with open(markdown_path, encoding="utf-8") as f:
-                markdown_content = f.read()
+            markdown_content = _read_markdown(markdown_path)
 
             # Process markdown
             processed_content = self._process_markdown(markdown_content)
@@ -145,76 +360,34 @@ class MarkdownToPDFConverter:
 
     def _process_markdown(self, content: str) -> str:
         """Process markdown content for PDF generation."""
-        # Configure markdown extensions
-        extensions = self.markdown_config.get(
-            "extensions", ["tables", "fenced_code", "toc"]
-        )
+        with self._md_lock:
+            html = self._html_cache.get(content)
+            if html is not None:
+                self._html_cache.move_to_end(content)
+                return html
 
-        # Process with markdown
-        html_content = markdown.markdown(content, extensions=extensions)
-
-        # Add CSS for better PDF rendering
-        css_styles = """
-        <style>
-        body {
-            font-family: 'Times New Roman', serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-        }
-        h1, h2, h3, h4, h5, h6 {
-            color: #333;
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-        }
-        h1 { font-size: 1.8em; }
-        h2 { font-size: 1.5em; }
-        h3 { font-size: 1.3em; }
-        p {
-            margin-bottom: 1em;
-            text-align: justify;
-        }
-        code {
-            background-color: #f4f4f4;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }
-        pre {
-            background-color: #f4f4f4;
-            padding: 10px;
-            border-radius: 5px;
-            overflow-x: auto;
-        }
-        blockquote {
-            border-left: 4px solid #ddd;
-            margin: 0;
-            padding-left: 20px;
-            color: #666;
-        }
-        table {
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1em 0;
-        }
-        th, td {
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }
-        th {
-            background-color: #f2f2f2;
-        }
-        </style>
-        """
+            # Process with markdown
+            html_content = self._md.reset().convert(content)
+            html = f"<html><body>{html_content}</body></html>"
+            self._html_cache[content] = html
+            if len(self._html_cache) > _HTML_CACHE_MAX_ENTRIES:
+                self._html_cache.popitem(last=False)
 
-        return f"<html><head>{css_styles}</head><body>{html_content}</body></html>"
+        return html
 
     def _generate_pdf(self, html_content: str, output_path: Path):
         """Generate PDF from HTML content using WeasyPrint."""
+        if len(self._image_cache) > _IMAGE_CACHE_MAX_ENTRIES:
+            self._image_cache.clear()
+
         try:
             # Use WeasyPrint for better HTML to PDF conversion
-            pdf_bytes = weasyprint.HTML(string=html_content).write_pdf()
+            pdf_bytes = weasyprint.HTML(string=html_content).write_pdf(
+                stylesheets=[self._stylesheet],
+                font_config=self._font_config,
+                cache=self._image_cache,
+                optimize_images=True,
+            )
 
             with open(output_path, "wb") as f:
                 f.write(pdf_bytes)
@@ -352,45 +525,14 @@ class PDFToMarkdownConverter:
                     severity=ErrorSeverity.HIGH,
                 )
 
-            try:
-                import pdf2image
-                import pytesseract
-            except ImportError as e:
-                raise FileProcessingError(
-                    f"Required OCR dependencies not installed: {e}",
-                    file_path=str(pdf_path),
-                    severity=ErrorSeverity.HIGH,
-                )
-
-            # Convert PDF to images
-            try:
-                images = pdf2image.convert_from_path(pdf_path)
-            except Exception as e:
-                raise FileProcessingError(
-                    f"Failed to convert PDF to images: {e}",
-                    file_path=str(pdf_path),
-                    severity=ErrorSeverity.MEDIUM,
-                )
-
-            # Extract text from images using OCR
-            extracted_text = ""
-            for i, image in enumerate(images):
-                logger.info(f"Processing page {i + 1} of {len(images)}")
-
-                try:
-                    # Perform OCR
-                    page_text = pytesseract.image_to_string(
-                        image,
-                        lang=self.ocr_config.get("language", "eng"),
-                        config="--psm 6",  # Assume uniform block of text
-                    )
-                    extracted_text += page_text + "\n\n"
-                except Exception as e:
-                    raise FileProcessingError(
-                        f"Failed to extract text from PDF: {e}",
-                        file_path=str(pdf_path),
-                        severity=ErrorSeverity.MEDIUM,
-                    )
+            # Born-digital PDFs carry a text layer; only rasterize and OCR
+            # when some page has none
+            page_texts = self._extract_text_layer(pdf_path)
+            if page_texts and all(map(_has_text_layer, page_texts)):
+                logger.info(f"Using embedded text layer of {pdf_path}")
+            else:
+                page_texts = self._ocr_missing_pages(pdf_path, page_texts)
+            extracted_text = "".join(page_text + "\n\n" for page_text in page_texts)
 
             # Process extracted text
             markdown_content = self._process_extracted_text(extracted_text)
@@ -415,25 +557,148 @@ class PDFToMarkdownConverter:
                 severity=ErrorSeverity.MEDIUM,
             )
 
+    def _extract_text_layer(self, pdf_path: Path) -> list[str]:
+        """Return the embedded text of each page, or [] if it can't be read."""
+        try:
+            import pdfplumber
+        except ImportError:
+            return []
+
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                return [page.extract_text() or "" for page in pdf.pages]
+        except Exception as e:
+            logger.debug(f"Could not read text layer of {pdf_path}: {e}")
+            return []
+
+    def _ocr_missing_pages(self, pdf_path: Path, page_texts: list[str]) -> list[str]:
+        """OCR the pages whose text layer is missing, keeping the others."""
+        try:
+            import pdf2image
+
+            ocr_batch, max_workers = self._load_ocr_engine()
+        except ImportError as e:
+            raise FileProcessingError(
+                f"Required OCR dependencies not installed: {e}",
+                file_path=str(pdf_path),
+                severity=ErrorSeverity.HIGH,
+            )
+        except ValueError as e:
+            raise FileProcessingError(
+                str(e), file_path=str(pdf_path), severity=ErrorSeverity.HIGH
+            )
+
+        # Pages are rendered to files and handed to tesseract by path, so no
+        # page bitmap is ever held in memory; the files go with the folder
+        with tempfile.TemporaryDirectory(prefix="kindle_sync_ocr_") as output_folder:
+            # Convert PDF to images
+            try:
+                images = pdf2image.convert_from_path(
+                    pdf_path,
+                    dpi=self.ocr_config.get("dpi", 200),
+                    output_folder=output_folder,
+                    fmt="png",
+                    paths_only=True,
+                    thread_count=os.cpu_count() or 1,
+                )
+            except Exception as e:
+                raise FileProcessingError(
+                    f"Failed to convert PDF to images: {e}",
+                    file_path=str(pdf_path),
+                    severity=ErrorSeverity.MEDIUM,
+                )
+
+            # A text layer that doesn't line up with the pages can't be trusted
+            if len(page_texts) != len(images):
+                page_texts = [""] * len(images)
+            else:
+                page_texts = list(page_texts)
+            missing = [
+                i for i, text in enumerate(page_texts) if not _has_text_layer(text)
+            ]
+
+            # Extract text from images using OCR
+            try:
+                ocr_texts = self._ocr_pages(
+                    [images[i] for i in missing], ocr_batch, max_workers
+                )
+            except Exception as e:
+                raise FileProcessingError(
+                    f"Failed to extract text from PDF: {e}",
+                    file_path=str(pdf_path),
+                    severity=ErrorSeverity.MEDIUM,
+                )
+
+        for i, text in zip(missing, ocr_texts):
+            page_texts[i] = text
+        return page_texts
+
+    def _load_ocr_engine(self) -> tuple[Callable[[list, str], list[str]], int | None]:
+        """Return the configured engine's page-batch OCR callable and worker cap.
+
+        Raises ImportError if the engine isn't installed and ValueError if
+        it isn't known.
+        """
+        engine = self.ocr_config.get("engine", "tesseract")
+        if engine == "tesseract":
+            import pytesseract
+
+            return partial(_tesseract_pages, pytesseract.image_to_string), None
+        if engine == "paddle":
+            # Loads the model up front; it batches and threads internally, so
+            # pages are fed to it one at a time
+            _paddle_ocr(self.ocr_config.get("language", "eng"))
+            return _paddle_pages, 1
+        raise ValueError(f"Unsupported OCR engine: {engine}")
+
+    def _ocr_pages(
+        self,
+        images: list,
+        ocr_batch: Callable[[list, str], list[str]],
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """OCR page image files concurrently, returning their text in page order.
+
+        Pages are split into one contiguous batch per worker. A tesseract
+        batch is a single subprocess run, so its start-up is paid once per
+        core rather than once per page.
+        """
+        if not images:
+            return []
+        language = self.ocr_config.get("language", "eng")
+        max_workers = max(1, min(len(images), max_workers or os.cpu_count() or 1))
+        batch_size = -(-len(images) // max_workers)
+        starts = range(0, len(images), batch_size)
+
+        def ocr_pages(start: int) -> list[str]:
+            batch = images[start : start + batch_size]
+            logger.info(
+                f"Processing pages {start + 1}-{start + len(batch)} of {len(images)}"
+            )
+            return ocr_batch(batch, language)
+
+        # Batches already run in parallel; keep tesseract's own OpenMP
+        # threads from oversubscribing the cores
+        limit_threads = _single_threaded_tesseract if len(starts) > 1 else nullcontext
+        with limit_threads(), ThreadPoolExecutor(max_workers=len(starts)) as executor:
+            return [text for texts in executor.map(ocr_pages, starts) for text in texts]
+
     def _process_extracted_text(self, text: str) -> str:
         """Process extracted text to improve Markdown formatting."""
-        lines = text.split("\n")
-        processed_lines = []
+        processed_lines: list[str] = []
+        append = processed_lines.append
 
-        for line in lines:
+        for line in text.split("\n"):
             line = line.strip()
 
-            if not line:
-                processed_lines.append("")
-                continue
-
-            # Detect headings (simple heuristic)
-            if len(line) < 50 and line.isupper() and not line.endswith("."):
-                processed_lines.append(f"# {line}")
-            elif len(line) < 50 and not line.endswith("."):
-                processed_lines.append(f"## {line}")
+            # Detect headings (simple heuristic): short lines without a
+            # closing full stop, all-caps ones being top level
+            if not line or len(line) >= 50 or line.endswith("."):
+                append(line)
+            elif line.isupper():
+                append(f"# {line}")
             else:
-                processed_lines.append(line)
+                append(f"## {line}")
 
         return "\n".join(processed_lines)
 
@@ -9,9 +9,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import shutil  # noqa: E402
 import tempfile  # noqa: E402
-from collections.abc import Generator
 from typing import Any  # noqa: E402
-from unittest.mock import Mock  # noqa: E402
+from unittest.mock import Mock, patch  # noqa: E402
 
 import pytest  # noqa: E402
 import yaml  # noqa: E402
@@ -19,6 +18,83 @@ from loguru import logger  # noqa: E402
 
 from src.config import Config  # noqa: E402
 
+# Static sample payloads, built once per session and shared by reference.
+_SAMPLE_MARKDOWN = """# Test Document
+
+This is a test document for the Kindle Scribe sync system.
+
+## Features
+
+- Automated file watching
+- PDF conversion
+- Email integration
+
+### Code Example
+
+```python
+def hello_world():
+    print("Hello, Kindle Scribe!")
+```
+
+## Conclusion
+
+This system enables seamless sync between Kindle Scribe and Obsidian.
+"""
+
+_SAMPLE_PDF = b"""%PDF-1.4
+1 0 obj
+<<
+/Type /Catalog
+/Pages 2 0 R
+>>
+endobj
+
+2 0 obj
+<<
+/Type /Pages
+/Kids [3 0 R]
+/Count 1
+>>
+endobj
+
+3 0 obj
+<<
+/Type /Page
+/Parent 2 0 R
+/MediaBox [0 0 612 792]
+/Contents 4 0 R
+>>
+endobj
+
+4 0 obj
+<<
+/Length 44
+>>
+stream
+BT
+/F1 12 Tf
+72 720 Td
+(Hello World) Tj
+ET
+endstream
+endobj
+
+xref
+0 5
+0000000000 65535 f
+0000000009 00000 n
+0000000058 00000 n
+0000000115 00000 n
+0000000204 00000 n
+trailer
+<<
+/Size 5
+/Root 1 0 R
+>>
+startxref
+297
+%%EOF"""
+
 
 @pytest.fixture(scope="session")
 def test_data_dir() -> Path:
@@ -29,19 +105,16 @@ def test_data_dir() -> Path:
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for each test."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="kindle_sync_test_"))
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+def temp_dir(tmp_path: Path) -> Path:
+    """Per-test directory under pytest's session temp root, removed in bulk."""
+    return tmp_path
 
 
-@pytest.fixture
-def sample_config(obsidian_vault: Path) -> dict[str, Any]:
-    """Sample configuration for testing."""
+def _build_sample_config(vault_path: Path) -> dict[str, Any]:
+    """Build the sample configuration dict for a given vault."""
     return {
         "obsidian": {
-            "vault_path": str(obsidian_vault),
+            "vault_path": str(vault_path),
             "sync_folder": "Kindle Sync",
             "templates_folder": "Templates",
             "watch_subfolders": True,
@@ -97,25 +170,9 @@ def sample_config(obsidian_vault: Path) -> dict[str, Any]:
     }
 
 
-@pytest.fixture
-def config_file(temp_dir: Path, sample_config: dict[str, Any]) -> Path:
-    """Create a temporary config file for testing."""
-    config_path = temp_dir / "test_config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(sample_config, f)
-    return config_path
-
-
-@pytest.fixture
-def config(config_file: Path) -> Config:
-    """Create a Config instance for testing."""
-    return Config(str(config_file))
-
-
-@pytest.fixture
-def obsidian_vault(temp_dir: Path) -> Path:
-    """Create a mock Obsidian vault structure."""
-    vault_path = temp_dir / "obsidian_vault"
+def _build_obsidian_vault(root: Path) -> Path:
+    """Create a mock Obsidian vault structure under root."""
+    vault_path = root / "obsidian_vault"
     vault_path.mkdir()
 
     # Create sync folder
@@ -127,94 +184,69 @@ def obsidian_vault(temp_dir: Path) -> Path:
     templates_folder.mkdir()
 
     # Create backup folder
-    backup_folder = temp_dir / "Backups"
+    backup_folder = root / "Backups"
     backup_folder.mkdir()
 
     return vault_path
 
 
+def _write_config_file(root: Path, config_data: dict[str, Any]) -> Path:
+    """Dump config_data to a YAML file under root."""
+    config_path = root / "test_config.yaml"
+    with open(config_path, "w") as f:
+        yaml.dump(config_data, f)
+    return config_path
+
+
 @pytest.fixture
-def sample_markdown_content() -> str:
-    """Sample markdown content for testing."""
-    return """# Test Document
+def sample_config(obsidian_vault: Path) -> dict[str, Any]:
+    """Sample configuration for testing."""
+    return _build_sample_config(obsidian_vault)
 
-This is a test document for the Kindle Scribe sync system.
 
-## Features
+@pytest.fixture
+def config_file(temp_dir: Path, sample_config: dict[str, Any]) -> Path:
+    """Create a temporary config file for testing."""
+    return _write_config_file(temp_dir, sample_config)
 
-- Automated file watching
-- PDF conversion
-- Email integration
 
-### Code Example
+@pytest.fixture
+def config(config_file: Path) -> Config:
+    """Create a Config instance for testing."""
+    return Config(str(config_file))
 
-```python
-def hello_world():
-    print("Hello, Kindle Scribe!")
-```
 
-## Conclusion
+@pytest.fixture
+def obsidian_vault(temp_dir: Path) -> Path:
+    """Create a mock Obsidian vault structure."""
+    return _build_obsidian_vault(temp_dir)
 
-This system enables seamless sync between Kindle Scribe and Obsidian.
-"""
 
+@pytest.fixture(scope="module")
+def obsidian_vault_ro(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Module-scoped Obsidian vault shared by read-only tests."""
+    return _build_obsidian_vault(tmp_path_factory.mktemp("config_ro"))
 
-@pytest.fixture
-def sample_pdf_content() -> bytes:
-    """Sample PDF content for testing (minimal valid PDF)."""
-    return b"""%PDF-1.4
-1 0 obj
-<<
-/Type /Catalog
-/Pages 2 0 R
->>
-endobj
 
-2 0 obj
-<<
-/Type /Pages
-/Kids [3 0 R]
-/Count 1
->>
-endobj
+@pytest.fixture(scope="module")
+def config_ro(obsidian_vault_ro: Path) -> Config:
+    """Module-scoped Config parsed once; tests must not mutate or patch it."""
+    config_path = _write_config_file(
+        obsidian_vault_ro.parent, _build_sample_config(obsidian_vault_ro)
+    )
+    return Config(str(config_path))
 
-3 0 obj
-<<
-/Type /Page
-/Parent 2 0 R
-/MediaBox [0 0 612 792]
-/Contents 4 0 R
->>
-endobj
 
-4 0 obj
-<<
-/Length 44
->>
-stream
-BT
-/F1 12 Tf
-72 720 Td
-(Hello World) Tj
-ET
-endstream
-endobj
+@pytest.fixture(scope="session")
+def sample_markdown_content() -> str:
+    """Sample markdown content for testing."""
+    return _SAMPLE_MARKDOWN
 
-xref
-0 5
-0000000000 65535 f
-0000000009 00000 n
-0000000058 00000 n
-0000000115 00000 n
-0000000204 00000 n
-trailer
-<<
-/Size 5
-/Root 1 0 R
->>
-startxref
-297
-%%EOF"""
+
+@pytest.fixture(scope="session")
+def sample_pdf_content() -> bytes:
+    """Sample PDF content for testing (minimal valid PDF)."""
+    return _SAMPLE_PDF
 
 
 @pytest.fixture
@@ -238,6 +270,13 @@ def mock_file_system_event():
     return event
 
 
+@pytest.fixture(scope="session", autouse=True)
+def mock_observer_class():
+    """Replace the watchdog Observer so no test starts real OS watchers."""
+    with patch("src.file_watcher.Observer") as observer_class:
+        yield observer_class
+
+
 @pytest.fixture
 def mock_ocr_result():
     """Mock OCR result for testing."""
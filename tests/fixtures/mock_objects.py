@@ -2,9 +2,11 @@
 
 import shutil
 import tempfile
+from collections.abc import Mapping
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import Mock
 
@@ -13,6 +15,37 @@ from pathlib import Path
 from .sample_data import SampleData
 
 
+class StubConfig:
+    """Lightweight stand-in for Config backed by a flat key -> value map.
+
+    ``get`` is the map's own bound ``get``, which already has Config.get's
+    ``(key, default=None)`` signature. Pass read-only maps
+    (``MappingProxyType``) when the stub is shared between tests.
+
+    Other Config methods a test needs are named in ``mocked`` (plain Mocks)
+    or ``returning`` (Mocks returning the given value); ``reset()`` restores
+    them after a test has reconfigured them.
+    """
+
+    def __init__(
+        self,
+        values: Mapping[str, Any] = MappingProxyType({}),
+        *mocked: str,
+        **returning: Any,
+    ):
+        self.get = values.get
+        self._mocked = mocked
+        self._returning = returning
+        self.reset()
+
+    def reset(self):
+        """Replace every stubbed getter with a fresh Mock."""
+        for name in self._mocked:
+            setattr(self, name, Mock())
+        for name, value in self._returning.items():
+            setattr(self, name, Mock(return_value=value))
+
+
 class MockFactory:
     """Factory for creating mock objects."""
 
@@ -8,6 +8,50 @@ import yaml
 from src.config import Config
 from src.core.exceptions import ConfigurationError
 
+# Static payload for test_config_large_file, built and serialized once per session
+_LARGE_CONFIG_DATA = {
+    f"section_{i}": {f"key_{j}": f"value_{i}_{j}" for j in range(10)}
+    for i in range(100)
+}
+_LARGE_CONFIG_YAML = yaml.dump(_LARGE_CONFIG_DATA)
+
+# Hand-written YAML for the small validation configs; {vault} is substituted per test
+_MISSING_VAULT_YAML = b"""obsidian:
+  vault_path: /non/existent/path
+  sync_folder: Kindle Sync
+kindle:
+  email: test@kindle.com
+  smtp_server: smtp.gmail.com
+  smtp_username: test@gmail.com
+  smtp_password: test_password
+"""
+
+_INVALID_EMAIL_TMPL = b"""obsidian:
+  vault_path: '{vault}'
+  sync_folder: Kindle Sync
+kindle:
+  email: invalid-email
+  smtp_server: smtp.gmail.com
+  smtp_username: test@gmail.com
+  smtp_password: test_password
+"""
+
+_MISSING_SMTP_TMPL = b"""obsidian:
+  vault_path: '{vault}'
+  sync_folder: Kindle Sync
+kindle:
+  email: test@kindle.com
+  smtp_server: ''
+  smtp_username: ''
+  smtp_password: ''
+"""
+
+_TILDE_PATHS_YAML = b"""obsidian:
+  vault_path: ~/test_vault
+sync:
+  backup_folder: ~/backups
+"""
+
 
 class TestConfigIntegration:
     """Integration tests for Config class with real file operations."""
@@ -66,22 +110,8 @@ class TestConfigIntegration:
 
     def test_config_with_missing_vault_path(self, temp_dir):
         """Test Config validation with missing vault path."""
-        config_data = {
-            "obsidian": {
-                "vault_path": "/non/existent/path",
-                "sync_folder": "Kindle Sync",
-            },
-            "kindle": {
-                "email": "test@kindle.com",
-                "smtp_server": "smtp.gmail.com",
-                "smtp_username": "test@gmail.com",
-                "smtp_password": "test_password",
-            },
-        }
-
         config_file = temp_dir / "config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_bytes(_MISSING_VAULT_YAML)
 
         # Validation should fail during initialization
         with pytest.raises(ConfigurationError):
@@ -93,19 +123,10 @@ class TestConfigIntegration:
         vault_path = temp_dir / "obsidian_vault"
         vault_path.mkdir()
 
-        config_data = {
-            "obsidian": {"vault_path": str(vault_path), "sync_folder": "Kindle Sync"},
-            "kindle": {
-                "email": "invalid-email",  # Invalid email
-                "smtp_server": "smtp.gmail.com",
-                "smtp_username": "test@gmail.com",
-                "smtp_password": "test_password",
-            },
-        }
-
         config_file = temp_dir / "config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_bytes(
+            _INVALID_EMAIL_TMPL.replace(b"{vault}", str(vault_path).encode())
+        )
 
         # Validation should fail during initialization due to invalid email
         with pytest.raises(ConfigurationError):
@@ -117,19 +138,10 @@ class TestConfigIntegration:
         vault_path = temp_dir / "obsidian_vault"
         vault_path.mkdir()
 
-        config_data = {
-            "obsidian": {"vault_path": str(vault_path), "sync_folder": "Kindle Sync"},
-            "kindle": {
-                "email": "test@kindle.com",
-                "smtp_server": "",  # Missing SMTP server
-                "smtp_username": "",
-                "smtp_password": "",
-            },
-        }
-
         config_file = temp_dir / "config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_bytes(
+            _MISSING_SMTP_TMPL.replace(b"{vault}", str(vault_path).encode())
+        )
 
         config = Config(str(config_file))
 
@@ -138,14 +150,8 @@ class TestConfigIntegration:
 
     def test_config_path_expansion_with_tilde(self, temp_dir):
         """Test path expansion with tilde notation."""
-        config_data = {
-            "obsidian": {"vault_path": "~/test_vault"},
-            "sync": {"backup_folder": "~/backups"},
-        }
-
         config_file = temp_dir / "config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_bytes(_TILDE_PATHS_YAML)
 
         # Mock home directory
         with patch("pathlib.Path.expanduser") as mock_expand:
@@ -246,17 +252,9 @@ class TestConfigIntegration:
 
     def test_config_large_file(self, temp_dir):
         """Test Config with a large configuration file."""
-        # Create a large config with many nested sections
-        config_data = {}
-
-        for i in range(100):
-            config_data[f"section_{i}"] = {
-                f"key_{j}": f"value_{i}_{j}" for j in range(10)
-            }
-
+        # Write a large config with many nested sections
         config_file = temp_dir / "large_config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_text(_LARGE_CONFIG_YAML)
 
         # Test loading large config
         config = Config(str(config_file))
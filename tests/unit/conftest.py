@@ -0,0 +1,87 @@
+"""Fixtures shared by the unit test modules."""
+
+from functools import lru_cache
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.manager import DatabaseManager
+from src.database.models import Base
+
+
+@lru_cache(maxsize=None)
+def _get_engine(dsn: str):
+    """Create a SQLite engine with the model schema, once per DSN."""
+    # StaticPool keeps the single in-memory database alive for every checkout
+    engine = create_engine(
+        dsn,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=False,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, _record):
+        # Foreign keys are off by default in SQLite and cannot be toggled
+        # inside a transaction, so enable them as each connection opens.
+        # pysqlite's own transaction handling breaks SAVEPOINT, so BEGIN is
+        # emitted by SQLAlchemy instead.
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Shared in-memory SQLite engine for the model tests."""
+    return _get_engine("sqlite://")
+
+
+@pytest.fixture(scope="session")
+def shared_db_manager():
+    """In-memory DatabaseManager whose schema is built once per session."""
+    db_manager = DatabaseManager("sqlite://")
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT; hand BEGIN
+    # back to SQLAlchemy so nested transactions work.
+    @event.listens_for(db_manager.engine, "connect")
+    def _configure_connection(dbapi_connection, _record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(db_manager.engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    db_manager.create_tables()
+    return db_manager
+
+
+@pytest.fixture
+def db_manager(shared_db_manager):
+    """Yield the shared DatabaseManager inside a per-test transaction.
+
+    Sessions join an outer transaction through SAVEPOINTs, so their
+    commits stay invisible to other tests and everything is rolled
+    back on teardown.
+    """
+    connection = shared_db_manager.engine.connect()
+    transaction = connection.begin()
+    session_factory = shared_db_manager.SessionLocal
+    shared_db_manager.SessionLocal = sessionmaker(
+        bind=connection,
+        autocommit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+    yield shared_db_manager
+    shared_db_manager.SessionLocal = session_factory
+    transaction.rollback()
+    connection.close()
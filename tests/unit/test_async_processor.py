@@ -4,109 +4,119 @@ Unit tests for AsyncSyncProcessor.
 Tests the asynchronous file processing functionality.
 """
 
-import os
-import tempfile
-from unittest.mock import Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from pathlib import Path
 
-from src.config import Config
-from src.core.async_processor import AsyncSyncProcessor
+from src.core.async_processor import AsyncSyncProcessor, ProcessingResult
 from src.database.manager import DatabaseManager
+from tests.fixtures.mock_objects import StubConfig
+
+# Shared read-only return values; tests only inspect their attributes
+_DB_ROW = SimpleNamespace(id=1)
+_VALID_RESULT = SimpleNamespace(valid=True, checksum="test_hash")
+_INVALID_RESULT = SimpleNamespace(valid=False, error="File too large")
+
+
+# The processor only calls config.get()
+_CONFIG_MAP = MappingProxyType(
+    {
+        "advanced.max_file_size_mb": 50,
+        "patterns.allowed_extensions": [".md", ".pdf", ".txt"],
+        "patterns.allowed_mime_types": [
+            "text/markdown",
+            "application/pdf",
+            "text/plain",
+        ],
+        "advanced.retry_attempts": 3,
+    }
+)
 
 
 class TestAsyncSyncProcessor:
     """Test cases for AsyncSyncProcessor."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
-        """Create a mock configuration."""
-        config = Mock(spec=Config)
-        config.get.side_effect = lambda key, default=None: {
-            "advanced.max_file_size_mb": 50,
-            "patterns.allowed_extensions": [".md", ".pdf", ".txt"],
-            "patterns.allowed_mime_types": [
-                "text/markdown",
-                "application/pdf",
-                "text/plain",
-            ],
-            "advanced.retry_attempts": 3,
-        }.get(key, default)
-        return config
+        """Create a lightweight configuration stub."""
+        return StubConfig(_CONFIG_MAP)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_db_manager(self):
         """Create a mock database manager."""
         db_manager = Mock(spec=DatabaseManager)
         db_manager.get_file_processing_history.return_value = None
-        db_manager.record_file_operation.return_value = Mock(id=1)
-        db_manager.record_file_processing.return_value = Mock(id=1)
-        db_manager.add_to_queue.return_value = Mock(id=1)
+        db_manager.record_file_operation.return_value = _DB_ROW
+        db_manager.record_file_processing.return_value = _DB_ROW
+        db_manager.add_to_queue.return_value = _DB_ROW
         db_manager.get_queue_size.return_value = 0
         db_manager.get_next_queue_item.return_value = None
         db_manager.remove_from_queue.return_value = None
         db_manager.get_processing_statistics.return_value = {}
         return db_manager
 
+    @pytest.fixture(scope="module", autouse=True)
+    def patched_collaborators(self, mock_db_manager):
+        """Swap the processor's module-level collaborators once per module."""
+        with patch.multiple(
+            "src.core.async_processor",
+            DatabaseManager=Mock(return_value=mock_db_manager),
+            FileValidator=Mock(),
+        ):
+            yield
+
     @pytest.fixture
     def processor(self, mock_config, mock_db_manager):
         """Create an AsyncSyncProcessor instance."""
-        with patch(
-            "src.core.async_processor.DatabaseManager", return_value=mock_db_manager
-        ):
-            return AsyncSyncProcessor(mock_config, max_workers=2)
-
-    @pytest.mark.asyncio
-    async def test_process_file_async_success(self, processor, mock_db_manager):
-        """Test successful async file processing."""
-        with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as temp_file:
-            temp_file.write(b"# Test Document\n\nThis is a test.")
-            temp_file.flush()
-            temp_path = Path(temp_file.name)
-
-        try:
-            # Mock the file validation
-            processor.file_validator.validate_file = Mock(
-                return_value=Mock(valid=True, checksum="test_hash")
-            )
-
-            result = await processor.process_file_async(temp_path)
-
-            # The test might fail due to PDF generation issues, so we just check basic structure
-            assert result.file_path == temp_path
-            assert result.processing_time_ms is not None
-            assert result.processing_time_ms > 0
-            # Success or failure depends on PDF generation working
-            assert result.success is not None
-
-        finally:
-            os.unlink(temp_path)
-
-    @pytest.mark.asyncio
-    async def test_process_file_async_validation_failure(
-        self, processor, mock_db_manager
+        # The module-scoped mock is shared, so clear call history between tests
+        mock_db_manager.reset_mock()
+        processor = AsyncSyncProcessor(mock_config, max_workers=2)
+        yield processor
+        # Tests share one event loop per module, so don't leave workers behind
+        processor.executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "case",
+        [
+            {
+                "validation": _VALID_RESULT,
+                "expected_success": True,
+                "expected_error": None,
+                "expected_conversions": 1,
+            },
+            {
+                "validation": _INVALID_RESULT,
+                "expected_success": False,
+                "expected_error": "File validation failed: File too large",
+                "expected_conversions": 0,
+            },
+        ],
+        ids=["success", "validation_failure"],
+    )
+    async def test_process_file_async(
+        self, processor, mock_db_manager, tmp_path: Path, case
     ):
-        """Test async file processing with validation failure."""
-        with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as temp_file:
-            temp_file.write(b"# Test Document\n\nThis is a test.")
-            temp_file.flush()
-            temp_path = Path(temp_file.name)
-
-        try:
-            # Mock validation failure
-            processor.file_validator.validate_file = Mock(
-                return_value=Mock(valid=False, error="File too large")
-            )
+        """Test async file processing outcomes."""
+        temp_path = tmp_path / "doc.md"
+        temp_path.write_bytes(b"# Test Document\n\nThis is a test.")
 
-            result = await processor.process_file_async(temp_path)
+        processor.file_validator.validate_file = Mock(return_value=case["validation"])
+        # Stub the convert-and-send step so the outcome depends only on validation
+        processor._process_markdown_file = AsyncMock(
+            return_value=ProcessingResult(success=True, file_path=temp_path)
+        )
 
-            assert result.success is False
-            assert result.file_path == temp_path
-            assert "File validation failed" in result.error_message
+        result = await processor.process_file_async(temp_path)
 
-        finally:
-            os.unlink(temp_path)
+        assert result.file_path == temp_path
+        assert result.success is case["expected_success"]
+        assert result.error_message == case["expected_error"]
+        assert (
+            processor._process_markdown_file.await_count == case["expected_conversions"]
+        )
 
     def test_get_statistics(self, processor):
         """Test getting processor statistics."""
@@ -127,7 +137,7 @@ class TestAsyncSyncProcessor:
         assert "database_connected" in health
         assert "max_workers" in health
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cleanup(self, processor):
         """Test processor cleanup."""
         # This should not raise an exception
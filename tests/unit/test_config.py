@@ -3,7 +3,6 @@
 from unittest.mock import patch
 
 import pytest
-import yaml
 from pathlib import Path
 
 from src.config import Config
@@ -39,53 +38,61 @@ class TestConfig:
         with pytest.raises(ConfigurationError):
             Config(str(invalid_yaml_file))
 
-    def test_get_method(self, config: Config, obsidian_vault: Path):
+    def test_get_method(self, config_ro: Config, obsidian_vault_ro: Path):
         """Test get method for configuration values."""
         # Test existing key
-        assert config.get("obsidian.vault_path") == str(obsidian_vault)
-        assert config.get("kindle.email") == "test@kindle.com"
+        assert config_ro.get("obsidian.vault_path") == str(obsidian_vault_ro)
+        assert config_ro.get("kindle.email") == "test@kindle.com"
 
         # Test non-existing key with default
-        assert config.get("non.existing.key", "default_value") == "default_value"
+        assert config_ro.get("non.existing.key", "default_value") == "default_value"
 
         # Test non-existing key without default
-        assert config.get("non.existing.key") is None
+        assert config_ro.get("non.existing.key") is None
 
-    def test_get_obsidian_vault_path(self, config: Config, obsidian_vault: Path):
+    def test_get_obsidian_vault_path(self, config_ro: Config, obsidian_vault_ro: Path):
         """Test get_obsidian_vault_path method."""
-        vault_path = config.get_obsidian_vault_path()
-        assert vault_path == obsidian_vault
+        vault_path = config_ro.get_obsidian_vault_path()
+        assert vault_path == obsidian_vault_ro
 
-    def test_get_sync_folder_path(self, config: Config, obsidian_vault: Path):
+    def test_get_obsidian_vault_path_cached(self, config: Config):
+        """Test that the vault path is only resolved once."""
+        first = config.get_obsidian_vault_path()
+        with patch.object(config, "get", side_effect=AssertionError("re-read")):
+            assert config.get_obsidian_vault_path() is first
+
+    def test_get_sync_folder_path(self, config_ro: Config, obsidian_vault_ro: Path):
         """Test get_sync_folder_path method."""
-        sync_path = config.get_sync_folder_path()
-        expected = obsidian_vault / "Kindle Sync"
+        sync_path = config_ro.get_sync_folder_path()
+        expected = obsidian_vault_ro / "Kindle Sync"
         assert sync_path == expected
 
-    def test_get_templates_folder_path(self, config: Config, obsidian_vault: Path):
+    def test_get_templates_folder_path(
+        self, config_ro: Config, obsidian_vault_ro: Path
+    ):
         """Test get_templates_folder_path method."""
-        templates_path = config.get_templates_folder_path()
-        expected = obsidian_vault / "Templates"
+        templates_path = config_ro.get_templates_folder_path()
+        expected = obsidian_vault_ro / "Templates"
         assert templates_path == expected
 
-    def test_get_backup_folder_path(self, config: Config):
+    def test_get_backup_folder_path(self, config_ro: Config):
         """Test get_backup_folder_path method."""
-        backup_path = config.get_backup_folder_path()
+        backup_path = config_ro.get_backup_folder_path()
         assert backup_path == Path.cwd() / "Backups"
 
-    def test_get_kindle_email(self, config: Config):
+    def test_get_kindle_email(self, config_ro: Config):
         """Test get_kindle_email method."""
-        email = config.get_kindle_email()
+        email = config_ro.get_kindle_email()
         assert email == "test@kindle.com"
 
-    def test_get_approved_senders(self, config: Config):
+    def test_get_approved_senders(self, config_ro: Config):
         """Test get_approved_senders method."""
-        senders = config.get_approved_senders()
+        senders = config_ro.get_approved_senders()
         assert senders == ["test@example.com"]
 
-    def test_get_smtp_config(self, config: Config):
+    def test_get_smtp_config(self, config_ro: Config):
         """Test get_smtp_config method."""
-        smtp_config = config.get_smtp_config()
+        smtp_config = config_ro.get_smtp_config()
         expected = {
             "server": "smtp.gmail.com",
             "port": 587,
@@ -94,15 +101,15 @@ class TestConfig:
         }
         assert smtp_config == expected
 
-    def test_get_ocr_config(self, config: Config):
+    def test_get_ocr_config(self, config_ro: Config):
         """Test get_ocr_config method."""
-        ocr_config = config.get_ocr_config()
+        ocr_config = config_ro.get_ocr_config()
         expected = {"language": "eng", "confidence_threshold": 60}
         assert ocr_config == expected
 
-    def test_get_pdf_config(self, config: Config):
+    def test_get_pdf_config(self, config_ro: Config):
         """Test get_pdf_config method."""
-        pdf_config = config.get_pdf_config()
+        pdf_config = config_ro.get_pdf_config()
         expected = {
             "page_size": "A4",
             "margins": [72, 72, 72, 72],
@@ -112,18 +119,18 @@ class TestConfig:
         }
         assert pdf_config == expected
 
-    def test_get_markdown_config(self, config: Config):
+    def test_get_markdown_config(self, config_ro: Config):
         """Test get_markdown_config method."""
-        markdown_config = config.get_markdown_config()
+        markdown_config = config_ro.get_markdown_config()
         expected = {
             "extensions": ["tables", "fenced_code", "toc"],
             "preserve_links": True,
         }
         assert markdown_config == expected
 
-    def test_get_sync_config(self, config: Config):
+    def test_get_sync_config(self, config_ro: Config):
         """Test get_sync_config method."""
-        sync_config = config.get_sync_config()
+        sync_config = config_ro.get_sync_config()
         expected = {
             "auto_convert_on_save": True,
             "auto_send_to_kindle": True,
@@ -132,9 +139,9 @@ class TestConfig:
         }
         assert sync_config == expected
 
-    def test_get_patterns(self, config: Config):
+    def test_get_patterns(self, config_ro: Config):
         """Test get_patterns method."""
-        patterns = config.get_patterns()
+        patterns = config_ro.get_patterns()
         expected = {
             "markdown_files": "*.md",
             "pdf_files": "*.pdf",
@@ -142,9 +149,9 @@ class TestConfig:
         }
         assert patterns == expected
 
-    def test_get_logging_config(self, config: Config):
+    def test_get_logging_config(self, config_ro: Config):
         """Test get_logging_config method."""
-        logging_config = config.get_logging_config()
+        logging_config = config_ro.get_logging_config()
         expected = {
             "level": "DEBUG",
             "file": "test.log",
@@ -153,9 +160,9 @@ class TestConfig:
         }
         assert logging_config == expected
 
-    def test_get_advanced_config(self, config: Config):
+    def test_get_advanced_config(self, config_ro: Config):
         """Test get_advanced_config method."""
-        advanced_config = config.get_advanced_config()
+        advanced_config = config_ro.get_advanced_config()
         expected = {
             "debounce_time": 0.1,
             "max_file_size": "10MB",
@@ -166,21 +173,14 @@ class TestConfig:
 
     def test_path_expansion(self, temp_dir: Path):
         """Test path expansion functionality."""
-        config_data = {
-            "obsidian": {"vault_path": "~/test_vault"},
-            "sync": {"backup_folder": "~/backups"},
-            "kindle": {"email": "test@kindle.com"},
-            "smtp": {
-                "host": "smtp.gmail.com",
-                "port": 587,
-                "username": "test@gmail.com",
-                "password": "test_password",
-            },
-        }
-
         config_file = temp_dir / "test_config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_text(
+            "obsidian:\n  vault_path: ~/test_vault\n"
+            "sync:\n  backup_folder: ~/backups\n"
+            "kindle:\n  email: test@kindle.com\n"
+            "smtp:\n  host: smtp.gmail.com\n  port: 587\n"
+            "  username: test@gmail.com\n  password: test_password\n"
+        )
 
         with patch("pathlib.Path.expanduser") as mock_expand, patch(
             "src.config.SecretsManager"
@@ -235,10 +235,8 @@ class TestConfig:
 
     def test_config_with_empty_values(self, temp_dir: Path):
         """Test Config with empty configuration values."""
-        empty_config = {}
         config_file = temp_dir / "empty_config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(empty_config, f)
+        config_file.write_text("{}\n")
 
         config = Config(str(config_file))
 
@@ -1,5 +1,6 @@
 """Tests for core exception handling."""
 
+import pytest
 
 from src.core.exceptions import (
     ConfigurationError,
@@ -29,23 +30,66 @@ class TestKindleSyncError:
         error = KindleSyncError("Test error", ErrorSeverity.HIGH, context=context)
         assert error.context == context
 
-    def test_error_severity_levels(self):
-        """Test all severity levels."""
-        for severity in ErrorSeverity:
-            error = KindleSyncError("Test", severity)
-            assert error.severity == severity
-            assert str(error) == f"[{severity.value.upper()}] Test"
-
-
-class TestFileProcessingError:
-    """Test file processing error."""
-
-    def test_file_processing_error_creation(self):
-        """Test file processing error creation."""
-        error = FileProcessingError("File not found", file_path="/test/file.md")
-        assert error.message == "File not found"
-        assert error.context["file_path"] == "/test/file.md"
-        assert error.severity == ErrorSeverity.MEDIUM
+    @pytest.mark.parametrize("severity", list(ErrorSeverity), ids=lambda s: s.name)
+    def test_error_severity_levels(self, severity):
+        """Test each severity level."""
+        error = KindleSyncError("Test", severity)
+        assert error.severity is severity
+        assert str(error) == f"[{severity.name}] Test"
+
+
+class TestErrorSubclasses:
+    """Test the specialised error subclasses."""
+
+    @pytest.mark.parametrize(
+        "error_class,message,kwargs,expected_severity",
+        [
+            (
+                FileProcessingError,
+                "File not found",
+                {"file_path": "/test/file.md"},
+                ErrorSeverity.MEDIUM,
+            ),
+            (
+                EmailServiceError,
+                "SMTP connection failed",
+                {"email_address": "test@example.com"},
+                ErrorSeverity.HIGH,
+            ),
+            (
+                ConfigurationError,
+                "Invalid config",
+                {"config_key": "smtp.host"},
+                ErrorSeverity.HIGH,
+            ),
+            (
+                ValidationError,
+                "Invalid input",
+                {"field_name": "email"},
+                ErrorSeverity.MEDIUM,
+            ),
+            (
+                SecretsError,
+                "Decryption failed",
+                {"secret_key": "smtp_password"},
+                ErrorSeverity.CRITICAL,
+            ),
+        ],
+        ids=[
+            "file_processing",
+            "email_service",
+            "configuration",
+            "validation",
+            "secrets",
+        ],
+    )
+    def test_error_creation(self, error_class, message, kwargs, expected_severity):
+        """Test error creation records the message, context key and severity."""
+        error = error_class(message, **kwargs)
+        assert error.message == message
+        for key, value in kwargs.items():
+            assert error.context[key] == value
+        assert error.severity == expected_severity
 
     def test_file_processing_error_custom_severity(self):
         """Test file processing error with custom severity."""
@@ -55,49 +99,3 @@ class TestFileProcessingError:
             severity=ErrorSeverity.CRITICAL,
         )
         assert error.severity == ErrorSeverity.CRITICAL
-
-
-class TestEmailServiceError:
-    """Test email service error."""
-
-    def test_email_service_error_creation(self):
-        """Test email service error creation."""
-        error = EmailServiceError(
-            "SMTP connection failed", email_address="test@example.com"
-        )
-        assert error.message == "SMTP connection failed"
-        assert error.context["email_address"] == "test@example.com"
-        assert error.severity == ErrorSeverity.HIGH
-
-
-class TestConfigurationError:
-    """Test configuration error."""
-
-    def test_configuration_error_creation(self):
-        """Test configuration error creation."""
-        error = ConfigurationError("Invalid config", config_key="smtp.host")
-        assert error.message == "Invalid config"
-        assert error.context["config_key"] == "smtp.host"
-        assert error.severity == ErrorSeverity.HIGH
-
-
-class TestValidationError:
-    """Test validation error."""
-
-    def test_validation_error_creation(self):
-        """Test validation error creation."""
-        error = ValidationError("Invalid input", field_name="email")
-        assert error.message == "Invalid input"
-        assert error.context["field_name"] == "email"
-        assert error.severity == ErrorSeverity.MEDIUM
-
-
-class TestSecretsError:
-    """Test secrets error."""
-
-    def test_secrets_error_creation(self):
-        """Test secrets error creation."""
-        error = SecretsError("Decryption failed", secret_key="smtp_password")
-        assert error.message == "Decryption failed"
-        assert error.context["secret_key"] == "smtp_password"
-        assert error.severity == ErrorSeverity.CRITICAL
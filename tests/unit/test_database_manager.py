@@ -4,10 +4,9 @@ Unit tests for DatabaseManager.
 Tests the database connection and operations management.
 """
 
-import tempfile
-
 import pytest
-from pathlib import Path
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.database.manager import DatabaseManager
 from src.database.models import (
@@ -18,28 +17,44 @@ from src.database.models import (
 )
 
 
+def _bulk_insert(db_manager, specs):
+    """Insert ProcessedFile rows in a single transaction and return their ids."""
+    with db_manager.get_session() as session:
+        rows = [
+            ProcessedFile(
+                file_path=path,
+                file_hash=file_hash,
+                file_size=size,
+                file_type=file_type,
+                status=status,
+            )
+            for path, file_hash, size, file_type, status in specs
+        ]
+        session.add_all(rows)
+        session.flush()
+        return [row.id for row in rows]
+
+
+def _count_metrics(db_manager, metric_name):
+    """Count stored rows for a metric without materializing ORM objects."""
+    with db_manager.get_session() as session:
+        return session.execute(
+            select(func.count())
+            .select_from(SystemMetrics)
+            .where(SystemMetrics.metric_name == metric_name)
+        ).scalar_one()
+
+
+def _raise_on_flush(session, flush_context, instances):
+    raise SQLAlchemyError("boom")
+
+
 class TestDatabaseManager:
     """Test cases for DatabaseManager."""
 
-    @pytest.fixture
-    def temp_db_path(self):
-        """Create a temporary database file path."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        yield temp_path
-        # Clean up
-        if temp_path.exists():
-            temp_path.unlink()
-
-    @pytest.fixture
-    def db_manager(self, temp_db_path):
-        """Create a DatabaseManager instance with temporary database."""
-        db_manager = DatabaseManager(str(temp_db_path))
-        db_manager.create_tables()
-        return db_manager
-
-    def test_database_initialization(self, temp_db_path):
+    def test_database_initialization(self, tmp_path):
         """Test database initialization."""
+        temp_db_path = tmp_path / "test.db"
         db_manager = DatabaseManager(str(temp_db_path))
         db_manager.create_tables()
 
@@ -129,6 +144,21 @@ class TestDatabaseManager:
         retrieved = db_manager.get_file_processing_history("/nonexistent/file.md")
         assert retrieved is None
 
+    def test_get_files_by_status(self, db_manager):
+        """Test listing files filtered by processing status."""
+        _bulk_insert(
+            db_manager,
+            [
+                ("/test/a.md", "hash_a", 100, ".md", ProcessingStatus.SUCCESS),
+                ("/test/b.pdf", "hash_b", 200, ".pdf", ProcessingStatus.SUCCESS),
+                ("/test/c.md", "hash_c", 300, ".md", ProcessingStatus.FAILED),
+            ],
+        )
+
+        # Rows come back detached and expired, so only compare counts
+        assert len(db_manager.get_files_by_status(ProcessingStatus.SUCCESS)) == 2
+        assert len(db_manager.get_files_by_status(ProcessingStatus.FAILED)) == 1
+
     def test_record_file_operation_success(self, db_manager):
         """Test successfully recording a file operation."""
         # First record a file processing
@@ -159,9 +189,7 @@ class TestDatabaseManager:
             tags={"status": "success", "file_type": ".md"},
         )
 
-        # Verify the metric was recorded
-        metrics = db_manager.get_metrics("files_processed_total")
-        assert len(metrics) > 0
+        assert _count_metrics(db_manager, "files_processed_total") == 1
 
     def test_record_metric_without_tags(self, db_manager):
         """Test recording a metric without tags."""
@@ -169,6 +197,31 @@ class TestDatabaseManager:
             metric_name="system_uptime_seconds", metric_value=3600.0
         )
 
-        # Verify the metric was recorded
-        metrics = db_manager.get_metrics("system_uptime_seconds")
-        assert len(metrics) > 0
+        assert _count_metrics(db_manager, "system_uptime_seconds") == 1
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda dm: dm.record_file_processing(
+                file_path="/test/error.md",
+                file_hash="h",
+                file_size=1,
+                file_type=".md",
+                status=ProcessingStatus.SUCCESS,
+            ),
+            lambda dm: dm.record_file_operation(
+                file_id=1,
+                operation_type="convert_markdown_to_pdf",
+                status=ProcessingStatus.FAILED,
+            ),
+            lambda dm: dm.record_metric(metric_name="errors", metric_value=1.0),
+        ],
+        ids=["record_file_processing", "record_file_operation", "record_metric"],
+    )
+    def test_write_database_error(self, db_manager, operation):
+        """Test that flush failures roll back and propagate from write helpers."""
+        # Scoped to this test's sessionmaker, so other sessions are unaffected
+        event.listen(db_manager.SessionLocal, "before_flush", _raise_on_flush)
+
+        with pytest.raises(SQLAlchemyError, match="boom"):
+            operation(db_manager)
@@ -7,35 +7,53 @@ Tests the SQLAlchemy models for persistent state management.
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
-from src.database.models import Base, FileOperation, ProcessedFile, SystemMetrics
+from src.database.models import FileOperation, ProcessedFile, SystemMetrics
 
+_SELECT_METRICS = select(SystemMetrics)
 
-class TestDatabaseModels:
-    """Test cases for database models."""
 
-    @pytest.fixture
-    def engine(self):
-        """Create an in-memory SQLite engine for testing."""
-        engine = create_engine("sqlite:///:memory:", echo=False)
-        Base.metadata.create_all(engine)
+def _bulk_insert(session, model, rows):
+    """Insert plain row mappings as one batched INSERT, bypassing the unit of work."""
+    session.execute(insert(model), rows)
 
-        # Enable foreign key constraints for SQLite
-        with engine.connect() as conn:
-            conn.execute(text("PRAGMA foreign_keys=ON"))
-            conn.commit()
 
-        return engine
+class TestDatabaseModels:
+    """Test cases for database models."""
 
     @pytest.fixture
     def session(self, engine):
-        """Create a database session."""
-        Session = sessionmaker(bind=engine)
-        session = Session()
+        """Create a session whose work is rolled back after each test."""
+        connection = engine.connect()
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
         yield session
         session.close()
+        transaction.rollback()
+        connection.close()
+
+    @pytest.fixture
+    def make_processed_file(self, session):
+        """Return a factory that flushes a ProcessedFile with default values."""
+
+        def _make(**overrides):
+            values = {
+                "file_path": "/test/path/document.md",
+                "file_hash": "abc123def456",
+                "file_size": 1024,
+                "file_type": ".md",
+                "status": "success",
+                **overrides,
+            }
+            processed_file = ProcessedFile(**values)
+            session.add(processed_file)
+            session.flush()
+            return processed_file
+
+        return _make
 
     def test_processed_file_creation(self, session):
         """Test creating a ProcessedFile record."""
@@ -49,19 +67,18 @@ class TestDatabaseModels:
         )
 
         session.add(processed_file)
-        session.commit()
-
-        # Verify the record was created
-        retrieved = session.query(ProcessedFile).first()
-        assert retrieved is not None
-        assert retrieved.file_path == "/test/path/document.md"
-        assert retrieved.file_hash == "abc123def456"
-        assert retrieved.file_size == 1024
-        assert retrieved.file_type == ".md"
-        assert retrieved.status == "success"
-        assert retrieved.processing_time_ms == 1500
-        assert retrieved.processed_at is not None
-        assert retrieved.error_message is None
+        session.flush()
+
+        # The flushed instance is what the identity map would return
+        assert processed_file.id is not None
+        assert processed_file.file_path == "/test/path/document.md"
+        assert processed_file.file_hash == "abc123def456"
+        assert processed_file.file_size == 1024
+        assert processed_file.file_type == ".md"
+        assert processed_file.status == "success"
+        assert processed_file.processing_time_ms == 1500
+        assert processed_file.processed_at is not None
+        assert processed_file.error_message is None
 
     def test_processed_file_with_error(self, session):
         """Test creating a ProcessedFile record with an error."""
@@ -76,27 +93,17 @@ class TestDatabaseModels:
         )
 
         session.add(processed_file)
-        session.commit()
+        session.flush()
 
-        # Verify the record was created
-        retrieved = session.query(ProcessedFile).first()
-        assert retrieved is not None
-        assert retrieved.status == "failed"
-        assert retrieved.error_message == "Conversion failed"
-        assert retrieved.processing_time_ms == 5000
+        # The flushed instance is what the identity map would return
+        assert processed_file.id is not None
+        assert processed_file.status == "failed"
+        assert processed_file.error_message == "Conversion failed"
+        assert processed_file.processing_time_ms == 5000
 
-    def test_file_operation_creation(self, session):
+    def test_file_operation_creation(self, session, make_processed_file):
         """Test creating a FileOperation record."""
-        # First create a ProcessedFile
-        processed_file = ProcessedFile(
-            file_path="/test/path/document.md",
-            file_hash="abc123def456",
-            file_size=1024,
-            file_type=".md",
-            status="success",
-        )
-        session.add(processed_file)
-        session.commit()
+        processed_file = make_processed_file()
 
         # Create a FileOperation
         file_operation = FileOperation(
@@ -107,29 +114,19 @@ class TestDatabaseModels:
         )
 
         session.add(file_operation)
-        session.commit()
-
-        # Verify the record was created
-        retrieved = session.query(FileOperation).first()
-        assert retrieved is not None
-        assert retrieved.file_id == processed_file.id
-        assert retrieved.operation_type == "convert_markdown_to_pdf"
-        assert retrieved.status == "success"
-        assert retrieved.details == "PDF generated successfully"
-        assert retrieved.timestamp is not None
-
-    def test_file_operation_relationship(self, session):
+        session.flush()
+
+        # The flushed instance is what the identity map would return
+        assert file_operation.id is not None
+        assert file_operation.file_id == processed_file.id
+        assert file_operation.operation_type == "convert_markdown_to_pdf"
+        assert file_operation.status == "success"
+        assert file_operation.details == "PDF generated successfully"
+        assert file_operation.timestamp is not None
+
+    def test_file_operation_relationship(self, session, make_processed_file):
         """Test the relationship between ProcessedFile and FileOperation."""
-        # Create a ProcessedFile
-        processed_file = ProcessedFile(
-            file_path="/test/path/document.md",
-            file_hash="abc123def456",
-            file_size=1024,
-            file_type=".md",
-            status="success",
-        )
-        session.add(processed_file)
-        session.commit()
+        processed_file = make_processed_file()
 
         # Create multiple FileOperations
         operation1 = FileOperation(
@@ -144,7 +141,7 @@ class TestDatabaseModels:
         )
 
         session.add_all([operation1, operation2])
-        session.commit()
+        session.flush()
 
         # Test the relationship
         assert len(processed_file.operations) == 2
@@ -160,42 +157,31 @@ class TestDatabaseModels:
         )
 
         session.add(metric)
-        session.commit()
+        session.flush()
 
-        # Verify the record was created
-        retrieved = session.query(SystemMetrics).first()
-        assert retrieved is not None
-        assert retrieved.name == "files_processed_total"
-        assert retrieved.value == 42.0
-        assert retrieved.labels == '{"status": "success", "file_type": ".md"}'
-        assert retrieved.timestamp is not None
+        # The flushed instance is what the identity map would return
+        assert metric.id is not None
+        assert metric.name == "files_processed_total"
+        assert metric.value == 42.0
+        assert metric.labels == '{"status": "success", "file_type": ".md"}'
+        assert metric.timestamp is not None
 
     def test_metric_without_labels(self, session):
         """Test creating a SystemMetrics record without labels."""
         metric = SystemMetrics(name="system_uptime_seconds", value=3600.0)
 
         session.add(metric)
-        session.commit()
+        session.flush()
 
-        # Verify the record was created
-        retrieved = session.query(SystemMetrics).first()
-        assert retrieved is not None
-        assert retrieved.name == "system_uptime_seconds"
-        assert retrieved.value == 3600.0
-        assert retrieved.labels is None
+        # The flushed instance is what the identity map would return
+        assert metric.id is not None
+        assert metric.name == "system_uptime_seconds"
+        assert metric.value == 3600.0
+        assert metric.labels is None
 
-    def test_processed_file_unique_constraint(self, session):
+    def test_processed_file_unique_constraint(self, session, make_processed_file):
         """Test that file_path is unique."""
-        # Create first record
-        processed_file1 = ProcessedFile(
-            file_path="/test/path/document.md",
-            file_hash="abc123def456",
-            file_size=1024,
-            file_type=".md",
-            status="success",
-        )
-        session.add(processed_file1)
-        session.commit()
+        make_processed_file()
 
         # Try to create second record with same file_path
         processed_file2 = ProcessedFile(
@@ -205,21 +191,16 @@ class TestDatabaseModels:
             file_type=".md",
             status="success",
         )
-        session.add(processed_file2)
 
-        # This should raise an integrity error
-        with pytest.raises(Exception):  # SQLAlchemy will raise an exception
-            session.commit()
+        # Only the savepoint is rolled back when the INSERT fails
+        with pytest.raises(IntegrityError), session.begin_nested():
+            session.add(processed_file2)
 
     def test_processed_file_required_fields(self, session):
         """Test that required fields are enforced."""
         # Try to create a record without required fields
-        processed_file = ProcessedFile()
-        session.add(processed_file)
-
-        # This should raise an exception
-        with pytest.raises(Exception):  # SQLAlchemy will raise an exception
-            session.commit()
+        with pytest.raises(IntegrityError), session.begin_nested():
+            session.add(ProcessedFile())
 
     def test_file_operation_foreign_key(self, session):
         """Test that FileOperation requires a valid file_id."""
@@ -229,25 +210,15 @@ class TestDatabaseModels:
             operation_type="test_operation",
             status="success",
         )
-        session.add(file_operation)
 
-        # This should raise an exception
-        with pytest.raises(Exception):  # SQLAlchemy will raise an exception
-            session.commit()
+        with pytest.raises(IntegrityError), session.begin_nested():
+            session.add(file_operation)
 
-    def test_timestamp_auto_generation(self, session):
+    def test_timestamp_auto_generation(self, make_processed_file):
         """Test that timestamps are automatically generated."""
         before_creation = datetime.utcnow()
 
-        processed_file = ProcessedFile(
-            file_path="/test/path/document.md",
-            file_hash="abc123def456",
-            file_size=1024,
-            file_type=".md",
-            status="success",
-        )
-        session.add(processed_file)
-        session.commit()
+        processed_file = make_processed_file()
 
         after_creation = datetime.utcnow()
 
@@ -256,20 +227,20 @@ class TestDatabaseModels:
 
     def test_metric_float_values(self, session):
         """Test that SystemMetrics can handle various float values."""
-        # Test with integer-like float
-        metric1 = SystemMetrics(name="count", value=42.0)
-
-        # Test with decimal float
-        metric2 = SystemMetrics(name="rate", value=0.95)
-
-        # Test with large float
-        metric3 = SystemMetrics(name="size", value=1234567.89)
-
-        session.add_all([metric1, metric2, metric3])
-        session.commit()
+        # Integer-like, decimal and large floats; mappings use column names
+        # because the name/value aliases are plain Python properties
+        _bulk_insert(
+            session,
+            SystemMetrics,
+            [
+                {"metric_name": "count", "metric_value": 42.0},
+                {"metric_name": "rate", "metric_value": 0.95},
+                {"metric_name": "size", "metric_value": 1234567.89},
+            ],
+        )
 
         # Verify all were stored correctly
-        metrics = session.query(SystemMetrics).all()
+        metrics = session.execute(_SELECT_METRICS).scalars().all()
         assert len(metrics) == 3
 
         values = [m.value for m in metrics]
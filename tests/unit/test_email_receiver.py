@@ -4,8 +4,7 @@ Unit tests for email receiver functionality.
 Tests the email receiving and processing functionality.
 """
 
-import tempfile
-from email.mime.application import MIMEApplication
+from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from unittest.mock import Mock, patch
@@ -13,50 +12,108 @@ from unittest.mock import Mock, patch
 import pytest
 from pathlib import Path
 
-from src.config import Config
 from src.core.exceptions import EmailServiceError, ErrorSeverity
 from src.email_receiver import EmailReceiver
+from tests.fixtures.mock_objects import StubConfig
+
+_CONFIG_DEFAULTS = {
+    "email_receiving.enabled": True,
+    "email_receiving.imap_server": "imap.gmail.com",
+    "email_receiving.imap_port": 993,
+    "email_receiving.username": "test@example.com",
+    "email_receiving.password": "test_password",
+    "email_receiving.check_interval": 300,
+    "email_receiving.max_emails_per_check": 10,
+    "email_receiving.mark_as_read": True,
+    "email_receiving.delete_after_processing": False,
+    "email_receiving.prevent_duplicates": True,
+    "email_receiving.duplicate_tracking_file": "/tmp/processed_emails.txt",
+}
+
+
+def _stub_config(values=_CONFIG_DEFAULTS):
+    """Create a config stub covering what EmailReceiver reads."""
+    # Tests point get_sync_folder_path at their own folders
+    return StubConfig(
+        values,
+        "get_sync_folder_path",
+        get_kindle_email="kindle@example.com",
+        get_approved_senders=["test@example.com", "kindle@example.com"],
+    )
+
+
+def _build_message(subject, *attachments):
+    """Create a multipart email carrying the given attachment parts."""
+    msg = MIMEMultipart()
+    msg["From"] = "test@example.com"
+    msg["To"] = "kindle@example.com"
+    msg["Subject"] = subject
+    for attachment in attachments:
+        msg.attach(attachment)
+    return msg
+
+
+def _pdf_part(content, filename):
+    """Create a PDF attachment part with an unencoded payload."""
+    # No Content-Transfer-Encoding, so get_payload(decode=True) returns the
+    # bytes as-is and the base64 round trip is skipped
+    part = MIMEBase("application", "pdf")
+    part.set_payload(content)
+    part.add_header("Content-Disposition", "attachment", filename=filename)
+    return part
 
 
 class TestEmailReceiver:
     """Test cases for EmailReceiver."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
-        """Create a mock configuration."""
-        config = Mock(spec=Config)
-        config.get.side_effect = lambda key, default=None: {
-            "email_receiving.enabled": True,
-            "email_receiving.imap_server": "imap.gmail.com",
-            "email_receiving.imap_port": 993,
-            "email_receiving.username": "test@example.com",
-            "email_receiving.password": "test_password",
-            "email_receiving.check_interval": 300,
-            "email_receiving.max_emails_per_check": 10,
-            "email_receiving.mark_as_read": True,
-            "email_receiving.delete_after_processing": False,
-            "email_receiving.prevent_duplicates": True,
-            "email_receiving.duplicate_tracking_file": "/tmp/processed_emails.txt",
-        }.get(key, default)
-
-        # Mock config methods
-        config.get_kindle_email.return_value = "kindle@example.com"
-        config.get_approved_senders.return_value = [
-            "test@example.com",
-            "kindle@example.com",
-        ]
-        return config
+        """Create a configuration stub shared by read-only tests."""
+        return _stub_config()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def email_receiver(self, mock_config):
-        """Create an EmailReceiver instance."""
+        """Create an EmailReceiver instance shared by read-only tests."""
         return EmailReceiver(mock_config)
 
+    @pytest.fixture(scope="module")
+    def pdf_email(self):
+        """Email with a single PDF attachment."""
+        return _build_message("Test PDF", _pdf_part(b"PDF content", "test.pdf"))
+
+    @pytest.fixture(scope="module")
+    def no_pdf_email(self):
+        """Email with only a text attachment."""
+        text_attachment = MIMEText("Text content", _subtype="plain")
+        text_attachment.add_header(
+            "Content-Disposition", "attachment", filename="test.txt"
+        )
+        return _build_message("Test Email", text_attachment)
+
+    @pytest.fixture(scope="module")
+    def multi_pdf_email(self):
+        """Email with two PDF attachments."""
+        return _build_message(
+            "Multiple PDFs",
+            _pdf_part(b"PDF 1 content", "test1.pdf"),
+            _pdf_part(b"PDF 2 content", "test2.pdf"),
+        )
+
     @pytest.fixture
-    def temp_directory(self):
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def mock_imap(self):
+        """Patch the IMAP client class used by EmailReceiver."""
+        with patch("src.email_receiver.imaplib.IMAP4_SSL") as mock_imap:
+            yield mock_imap
+
+    @pytest.fixture
+    def fresh_config(self):
+        """Create a configuration stub a test may reconfigure."""
+        return _stub_config()
+
+    @pytest.fixture
+    def fresh_receiver(self, fresh_config):
+        """Create an EmailReceiver for tests that change config or stats."""
+        return EmailReceiver(fresh_config)
 
     def test_email_receiver_initialization(self, mock_config):
         """Test email receiver initialization."""
@@ -66,16 +123,11 @@ class TestEmailReceiver:
         assert receiver.kindle_email == "kindle@example.com"
         assert receiver.approved_senders == ["test@example.com", "kindle@example.com"]
 
-    def test_email_receiver_disabled(self, mock_config):
+    def test_email_receiver_disabled(self):
         """Test email receiver when disabled."""
-        mock_config.get.side_effect = lambda key, default=None: {
-            "email_receiving.enabled": False
-        }.get(key, default)
-
-        receiver = EmailReceiver(mock_config)
+        receiver = EmailReceiver(_stub_config({"email_receiving.enabled": False}))
         assert receiver.enabled is False
 
-    @patch("src.email_receiver.imaplib.IMAP4_SSL")
     def test_connect_to_imap_success(self, mock_imap, email_receiver):
         """Test successful IMAP connection."""
         # Mock IMAP connection
@@ -91,7 +143,6 @@ class TestEmailReceiver:
             "test@example.com", "test_password"
         )
 
-    @patch("src.email_receiver.imaplib.IMAP4_SSL")
     def test_connect_to_imap_connection_error(self, mock_imap, email_receiver):
         """Test IMAP connection error."""
         # Mock connection error
@@ -103,7 +154,6 @@ class TestEmailReceiver:
         assert exc_info.value.severity == ErrorSeverity.HIGH
         assert "Failed to connect to IMAP server" in str(exc_info.value)
 
-    @patch("src.email_receiver.imaplib.IMAP4_SSL")
     def test_connect_to_imap_login_error(self, mock_imap, email_receiver):
         """Test IMAP login error."""
         # Mock IMAP connection
@@ -117,93 +167,53 @@ class TestEmailReceiver:
         assert exc_info.value.severity == ErrorSeverity.HIGH
         assert "Failed to login to IMAP server" in str(exc_info.value)
 
-    def test_is_approved_sender_approved(self, email_receiver):
-        """Test checking approved sender."""
-        assert email_receiver._is_approved_sender("test@example.com") is True
-        assert email_receiver._is_approved_sender("kindle@example.com") is True
-
-    def test_is_approved_sender_not_approved(self, email_receiver):
-        """Test checking non-approved sender."""
-        assert email_receiver._is_approved_sender("spam@example.com") is False
-        assert email_receiver._is_approved_sender("unknown@example.com") is False
-
-    def test_is_approved_sender_case_insensitive(self, email_receiver):
-        """Test approved sender check is case insensitive."""
-        assert email_receiver._is_approved_sender("TEST@EXAMPLE.COM") is True
-        assert email_receiver._is_approved_sender("Test@Example.Com") is True
-
-    def test_extract_pdf_attachments_success(self, email_receiver):
+    @pytest.mark.parametrize(
+        "sender,expected",
+        [
+            ("test@example.com", True),
+            ("kindle@example.com", True),
+            ("spam@example.com", False),
+            ("unknown@example.com", False),
+            ("TEST@EXAMPLE.COM", True),
+            ("Test@Example.Com", True),
+        ],
+    )
+    def test_is_approved_sender(self, email_receiver, sender, expected):
+        """Test approved sender check, including case insensitivity."""
+        assert email_receiver._is_approved_sender(sender) is expected
+
+    def test_extract_pdf_attachments_success(self, email_receiver, pdf_email):
         """Test successful PDF attachment extraction."""
-        # Create a mock email with PDF attachment
-        msg = MIMEMultipart()
-        msg["From"] = "test@example.com"
-        msg["To"] = "kindle@example.com"
-        msg["Subject"] = "Test PDF"
-
-        # Add PDF attachment
-        pdf_attachment = MIMEApplication(b"PDF content", _subtype="pdf")
-        pdf_attachment.add_header(
-            "Content-Disposition", "attachment", filename="test.pdf"
-        )
-        msg.attach(pdf_attachment)
-
-        attachments = email_receiver._extract_pdf_attachments(msg)
+        attachments = email_receiver._extract_pdf_attachments(pdf_email)
 
         assert len(attachments) == 1
         assert attachments[0]["filename"] == "test.pdf"
         assert attachments[0]["content"] == b"PDF content"
 
-    def test_extract_pdf_attachments_no_pdf(self, email_receiver):
+    def test_extract_pdf_attachments_no_pdf(self, email_receiver, no_pdf_email):
         """Test email with no PDF attachments."""
-        # Create a mock email without PDF attachment
-        msg = MIMEMultipart()
-        msg["From"] = "test@example.com"
-        msg["To"] = "kindle@example.com"
-        msg["Subject"] = "Test Email"
-
-        # Add text attachment
-        text_attachment = MIMEText("Text content", _subtype="plain")
-        text_attachment.add_header(
-            "Content-Disposition", "attachment", filename="test.txt"
-        )
-        msg.attach(text_attachment)
-
-        attachments = email_receiver._extract_pdf_attachments(msg)
+        attachments = email_receiver._extract_pdf_attachments(no_pdf_email)
 
         assert len(attachments) == 0
 
-    def test_extract_pdf_attachments_multiple_pdfs(self, email_receiver):
+    def test_extract_pdf_attachments_multiple_pdfs(
+        self, email_receiver, multi_pdf_email
+    ):
         """Test email with multiple PDF attachments."""
-        # Create a mock email with multiple PDF attachments
-        msg = MIMEMultipart()
-        msg["From"] = "test@example.com"
-        msg["To"] = "kindle@example.com"
-        msg["Subject"] = "Multiple PDFs"
-
-        # Add first PDF
-        pdf1 = MIMEApplication(b"PDF 1 content", _subtype="pdf")
-        pdf1.add_header("Content-Disposition", "attachment", filename="test1.pdf")
-        msg.attach(pdf1)
-
-        # Add second PDF
-        pdf2 = MIMEApplication(b"PDF 2 content", _subtype="pdf")
-        pdf2.add_header("Content-Disposition", "attachment", filename="test2.pdf")
-        msg.attach(pdf2)
-
-        attachments = email_receiver._extract_pdf_attachments(msg)
+        attachments = email_receiver._extract_pdf_attachments(multi_pdf_email)
 
         assert len(attachments) == 2
         assert attachments[0]["filename"] == "test1.pdf"
         assert attachments[1]["filename"] == "test2.pdf"
 
-    def test_save_pdf_attachment_success(self, email_receiver, temp_directory):
+    def test_save_pdf_attachment_success(self, fresh_receiver, fresh_config, tmp_path):
         """Test successful PDF attachment saving."""
         # Mock the sync folder path
-        email_receiver.config.get_sync_folder_path.return_value = temp_directory
+        fresh_config.get_sync_folder_path.return_value = tmp_path
 
         attachment = {"filename": "test.pdf", "content": b"PDF content"}
 
-        result = email_receiver._save_pdf_attachment(attachment)
+        result = fresh_receiver._save_pdf_attachment(attachment)
 
         assert result is not None
         assert result.exists()
@@ -211,34 +221,34 @@ class TestEmailReceiver:
         assert result.read_bytes() == b"PDF content"
 
     def test_save_pdf_attachment_duplicate_filename(
-        self, email_receiver, temp_directory
+        self, fresh_receiver, fresh_config, tmp_path
     ):
         """Test saving PDF attachment with duplicate filename."""
         # Mock the sync folder path
-        email_receiver.config.get_sync_folder_path.return_value = temp_directory
+        fresh_config.get_sync_folder_path.return_value = tmp_path
 
         # Create existing file
-        existing_file = temp_directory / "test.pdf"
+        existing_file = tmp_path / "test.pdf"
         existing_file.write_bytes(b"Existing content")
 
         attachment = {"filename": "test.pdf", "content": b"New PDF content"}
 
-        result = email_receiver._save_pdf_attachment(attachment)
+        result = fresh_receiver._save_pdf_attachment(attachment)
 
         assert result is not None
         assert result.exists()
         # Should have a different name due to duplicate
         assert result.name != "test.pdf" or result.read_bytes() == b"New PDF content"
 
-    def test_save_pdf_attachment_error(self, email_receiver):
+    def test_save_pdf_attachment_error(self, fresh_receiver, fresh_config):
         """Test PDF attachment saving error."""
         # Mock invalid sync folder path
-        email_receiver.config.get_sync_folder_path.return_value = Path("/invalid/path")
+        fresh_config.get_sync_folder_path.return_value = Path("/invalid/path")
 
         attachment = {"filename": "test.pdf", "content": b"PDF content"}
 
         with pytest.raises(EmailServiceError) as exc_info:
-            email_receiver._save_pdf_attachment(attachment)
+            fresh_receiver._save_pdf_attachment(attachment)
 
         assert exc_info.value.severity == ErrorSeverity.MEDIUM
         assert "Failed to save PDF attachment" in str(exc_info.value)
@@ -283,45 +293,45 @@ class TestEmailReceiver:
 
         assert result is False
 
-    def test_is_duplicate_email_not_duplicate(self, email_receiver, temp_directory):
+    def test_is_duplicate_email_not_duplicate(self, fresh_receiver, tmp_path):
         """Test checking non-duplicate email."""
         # Mock tracking file path
-        tracking_file = temp_directory / "processed_emails.txt"
-        email_receiver.config.get.side_effect = lambda key, default=None: {
-            "email_receiving.duplicate_tracking_file": str(tracking_file)
-        }.get(key, default)
+        tracking_file = tmp_path / "processed_emails.txt"
+        fresh_receiver.config = _stub_config(
+            {"email_receiving.duplicate_tracking_file": str(tracking_file)}
+        )
 
         # Create tracking file with different email ID
         tracking_file.write_text("different_email_id\n")
 
-        result = email_receiver._is_duplicate_email("new_email_id")
+        result = fresh_receiver._is_duplicate_email("new_email_id")
 
         assert result is False
 
-    def test_is_duplicate_email_duplicate(self, email_receiver, temp_directory):
+    def test_is_duplicate_email_duplicate(self, fresh_receiver, tmp_path):
         """Test checking duplicate email."""
         # Mock tracking file path
-        tracking_file = temp_directory / "processed_emails.txt"
-        email_receiver.config.get.side_effect = lambda key, default=None: {
-            "email_receiving.duplicate_tracking_file": str(tracking_file)
-        }.get(key, default)
+        tracking_file = tmp_path / "processed_emails.txt"
+        fresh_receiver.config = _stub_config(
+            {"email_receiving.duplicate_tracking_file": str(tracking_file)}
+        )
 
         # Create tracking file with same email ID
         tracking_file.write_text("test_email_id\n")
 
-        result = email_receiver._is_duplicate_email("test_email_id")
+        result = fresh_receiver._is_duplicate_email("test_email_id")
 
         assert result is True
 
-    def test_record_processed_email(self, email_receiver, temp_directory):
+    def test_record_processed_email(self, fresh_receiver, tmp_path):
         """Test recording processed email."""
         # Mock tracking file path
-        tracking_file = temp_directory / "processed_emails.txt"
-        email_receiver.config.get.side_effect = lambda key, default=None: {
-            "email_receiving.duplicate_tracking_file": str(tracking_file)
-        }.get(key, default)
+        tracking_file = tmp_path / "processed_emails.txt"
+        fresh_receiver.config = _stub_config(
+            {"email_receiving.duplicate_tracking_file": str(tracking_file)}
+        )
 
-        email_receiver._record_processed_email("test_email_id")
+        fresh_receiver._record_processed_email("test_email_id")
 
         assert tracking_file.exists()
         content = tracking_file.read_text()
@@ -336,13 +346,13 @@ class TestEmailReceiver:
         assert "pdfs_extracted" in stats
         assert "errors" in stats
 
-    def test_reset_statistics(self, email_receiver):
+    def test_reset_statistics(self, fresh_receiver):
         """Test resetting email receiver statistics."""
         # Set some statistics
-        email_receiver.stats["emails_checked"] = 10
-        email_receiver.stats["emails_processed"] = 5
+        fresh_receiver.stats["emails_checked"] = 10
+        fresh_receiver.stats["emails_processed"] = 5
 
-        email_receiver.reset_statistics()
+        fresh_receiver.reset_statistics()
 
-        assert email_receiver.stats["emails_checked"] == 0
-        assert email_receiver.stats["emails_processed"] == 0
+        assert fresh_receiver.stats["emails_checked"] == 0
+        assert fresh_receiver.stats["emails_processed"] == 0
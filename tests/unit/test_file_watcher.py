@@ -4,58 +4,83 @@ Unit tests for file watcher functionality.
 Tests the file system monitoring and event handling.
 """
 
-import tempfile
+import os
+import threading
+import time
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
 from pathlib import Path
-
-from src.config import Config
-from src.file_watcher import ObsidianFileWatcher
+from watchdog.events import (
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEvent,
+)
+
+from src.file_watcher import ObsidianFileHandler, ObsidianFileWatcher
+from tests.fixtures.mock_objects import StubConfig
+
+# Read-only, since every StubConfig shares it through the module fixtures
+_CONFIG_MAP = MappingProxyType(
+    {
+        "obsidian.watch_subfolders": True,
+        "advanced.debounce_time": 0.05,  # Very small for immediate processing
+        "patterns.markdown_files": "*.md",
+        "patterns.pdf_files": "*.pdf",
+    }
+)
+
+
+def _stub_config():
+    """Create a config stub whose path getters tests are free to reconfigure."""
+    return StubConfig(
+        _CONFIG_MAP,
+        "get_sync_folder_path",
+        "get_templates_folder_path",
+        get_obsidian_vault_path=Path("/tmp/test_vault"),
+    )
+
+
+@pytest.fixture(scope="module")
+def temp_directory(tmp_path_factory):
+    """Create a vault directory shared by the tests in this module."""
+    return tmp_path_factory.mktemp("vault")
 
 
 class TestObsidianFileWatcher:
     """Test cases for ObsidianFileWatcher."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
-        """Create a mock configuration."""
-        config = Mock(spec=Config)
-        config.get.side_effect = lambda key, default=None: {
-            "obsidian.watch_subfolders": True,
-            "advanced.debounce_time": 0.05,  # Very small for immediate processing in tests
-            "patterns.markdown_files": "*.md",
-            "patterns.pdf_files": "*.pdf",
-        }.get(key, default)
-
-        # Mock config methods
-        config.get_obsidian_vault_path.return_value = Path("/tmp/test_vault")
-        return config
+        """Create a lightweight configuration stub."""
+        return _stub_config()
 
-    @pytest.fixture
-    def temp_directory(self):
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_callback(self):
         """Create a mock callback function."""
         return Mock()
 
+    @pytest.fixture(autouse=True)
+    def _reset_shared_mocks(self, mock_config, mock_callback, mock_observer_class):
+        """Undo per-test changes to the module-scoped mocks."""
+        mock_config.reset()
+        mock_callback.reset_mock()
+        # A fresh return_value gives every watcher its own observer mock
+        mock_observer_class.reset_mock(return_value=True, side_effect=True)
+
     @pytest.fixture
     def file_watcher(self, mock_config, mock_callback):
         """Create a ObsidianFileWatcher instance."""
-        with patch("src.file_watcher.Observer"):
-            return ObsidianFileWatcher(mock_config, mock_callback)
+        return ObsidianFileWatcher(mock_config, mock_callback)
 
     def test_file_watcher_initialization(self, mock_config, mock_callback):
         """Test file watcher initialization."""
-        with patch("src.file_watcher.Observer"):
-            watcher = ObsidianFileWatcher(mock_config, mock_callback)
-            assert watcher.config == mock_config
-            assert watcher.callback == mock_callback
-            assert watcher.observer is not None
+        watcher = ObsidianFileWatcher(mock_config, mock_callback)
+        assert watcher.config == mock_config
+        assert watcher.callback == mock_callback
+        assert watcher.observer is not None
 
     def test_start_watching_success(self, file_watcher, temp_directory):
         """Test successful start of file watching."""
@@ -140,7 +165,7 @@ class TestObsidianFileWatcher:
         paths = file_watcher.get_watched_paths()
 
         assert len(paths) == 1
-        assert paths[0] == str(temp_directory)
+        assert paths[0] == os.fspath(temp_directory)
 
     def test_get_watched_paths_with_subfolders(self, file_watcher, temp_directory):
         """Test getting watched paths with subfolders."""
@@ -157,110 +182,69 @@ class TestObsidianFileWatcher:
 
         # Should include main directory and subdirectories
         assert len(paths) >= 1
-        assert str(temp_directory) in paths
-
-    def test_handle_file_event_created(self, file_watcher, temp_directory):
-        """Test handling file created event."""
-        # Create the test file
-        test_file = temp_directory / "test.md"
-        test_file.write_text("# Test")
-
-        # Mock event
-        mock_event = Mock()
-        mock_event.event_type = "created"
-        mock_event.src_path = str(test_file)
-        mock_event.is_directory = False
-
-        # Mock file processor
-        file_watcher.file_processor = Mock()
-
-        file_watcher._handle_file_event(mock_event)
-
-        # Should call file processor
-        file_watcher.file_processor.process_file.assert_called_once()
-
-    def test_handle_file_event_modified(self, file_watcher, temp_directory):
-        """Test handling file modified event."""
-        # Create the test file
-        test_file = temp_directory / "test.md"
-        test_file.write_text("# Test")
-
-        # Mock event
-        mock_event = Mock()
-        mock_event.event_type = "modified"
-        mock_event.src_path = str(test_file)
-        mock_event.is_directory = False
-
-        # Mock file processor
+        assert os.fspath(temp_directory) in paths
+
+    @pytest.mark.parametrize(
+        "event_type,name,is_directory,calls",
+        [
+            ("created", "test.md", False, 1),
+            ("modified", "test.md", False, 1),
+            ("created", "new_dir", True, 0),
+            ("created", "test.txt", False, 0),
+        ],
+        ids=["created", "modified", "directory", "unsupported_type"],
+    )
+    def test_handle_file_event(
+        self, file_watcher, temp_directory, event_type, name, is_directory, calls
+    ):
+        """Test which file events reach the file processor."""
+        mock_event = Mock(
+            spec_set=FileSystemEvent(""),
+            event_type=event_type,
+            src_path=str(temp_directory / name),
+            is_directory=is_directory,
+        )
         file_watcher.file_processor = Mock()
 
-        file_watcher._handle_file_event(mock_event)
+        # Processing skips missing files; pretend they exist instead of writing
+        with patch("pathlib.Path.exists", return_value=True):
+            file_watcher._handle_file_event(mock_event)
 
-        # Should call file processor
-        file_watcher.file_processor.process_file.assert_called_once()
+        assert file_watcher.file_processor.process_file.call_count == calls
 
     def test_handle_file_event_moved(self, file_watcher, temp_directory):
         """Test handling file moved event."""
-        # Create the test files
         old_file = temp_directory / "old.md"
         new_file = temp_directory / "new.md"
-        old_file.write_text("# Old")
-        new_file.write_text("# New")
 
         # Mock event
-        mock_event = Mock()
-        mock_event.event_type = "moved"
-        mock_event.src_path = str(old_file)
-        mock_event.dest_path = str(new_file)
-        mock_event.is_directory = False
+        mock_event = Mock(
+            spec_set=FileMovedEvent(""),
+            event_type="moved",
+            src_path=str(old_file),
+            dest_path=str(new_file),
+            is_directory=False,
+        )
 
         # Mock file processor
         file_watcher.file_processor = Mock()
 
-        file_watcher._handle_file_event(mock_event)
+        # Processing skips missing files; pretend they exist instead of writing
+        with patch("pathlib.Path.exists", return_value=True):
+            file_watcher._handle_file_event(mock_event)
 
         # Should call file processor for both old and new paths
         assert file_watcher.file_processor.process_file.call_count == 2
 
-    def test_handle_file_event_directory(self, file_watcher):
-        """Test handling directory event (should be ignored)."""
-        # Mock event
-        mock_event = Mock()
-        mock_event.event_type = "created"
-        mock_event.src_path = "/tmp/test_vault/new_dir"
-        mock_event.is_directory = True
-
-        # Mock file processor
-        file_watcher.file_processor = Mock()
-
-        file_watcher._handle_file_event(mock_event)
-
-        # Should not call file processor for directories
-        file_watcher.file_processor.process_file.assert_not_called()
-
-    def test_handle_file_event_unsupported_type(self, file_watcher):
-        """Test handling unsupported file type event."""
-        # Mock event
-        mock_event = Mock()
-        mock_event.event_type = "created"
-        mock_event.src_path = "/tmp/test_vault/test.txt"
-        mock_event.is_directory = False
-
-        # Mock file processor
-        file_watcher.file_processor = Mock()
-
-        file_watcher._handle_file_event(mock_event)
-
-        # Should not call file processor for unsupported types
-        file_watcher.file_processor.process_file.assert_not_called()
-
-    def test_handle_file_event_processor_error(self, file_watcher):
+    def test_handle_file_event_processor_error(self, file_watcher, temp_directory):
         """Test handling file event with processor error."""
         # Mock event
-        mock_event = Mock()
-        mock_event.event_type = "created"
-        mock_event.src_path = "/tmp/test_vault/test.md"
-        mock_event.is_directory = False
+        mock_event = Mock(
+            spec_set=FileCreatedEvent(""),
+            event_type="created",
+            src_path=str(temp_directory / "test.md"),
+            is_directory=False,
+        )
 
         # Mock file processor with error
         file_watcher.file_processor = Mock()
@@ -316,23 +300,242 @@ class TestObsidianFileWatcher:
         assert file_watcher.stats["events_processed"] == 0
         assert file_watcher.stats["files_created"] == 0
 
-    def test_debounce_mechanism(self, file_watcher):
+    def test_debounce_mechanism(self, file_watcher, temp_directory):
         """Test debounce mechanism for rapid file changes."""
         # Set a longer debounce time for this test
         file_watcher.debounce_time = 2.0
 
-        # Mock event
-        mock_event = Mock()
-        mock_event.event_type = "modified"
-        mock_event.src_path = "/tmp/test_vault/test.md"
-        mock_event.is_directory = False
-
-        # Mock file processor
+        mock_event = Mock(
+            spec_set=FileModifiedEvent(""),
+            event_type="modified",
+            src_path=str(temp_directory / "test.md"),
+            is_directory=False,
+        )
         file_watcher.file_processor = Mock()
 
-        # Process the same event multiple times rapidly
-        for _ in range(5):
-            file_watcher._handle_file_event(mock_event)
+        # Timers are recorded instead of started, so no time has to pass
+        with patch("src.file_watcher.threading.Timer") as mock_timer:
+            for _ in range(5):
+                file_watcher._handle_file_event(mock_event)
+
+        # Each event replaces the pending timer; none has fired yet
+        assert mock_timer.call_count == 5
+        assert mock_timer.return_value.cancel.call_count == 4
+        assert list(file_watcher.pending_files) == [temp_directory / "test.md"]
+        file_watcher.file_processor.process_file.assert_not_called()
+
+
+class TestObsidianFileHandler:
+    """Test cases for ObsidianFileHandler."""
+
+    @pytest.fixture(scope="module")
+    def handler_and_callback(self, temp_directory):
+        """Create one handler and callback shared by the tests in this class."""
+        config = _stub_config()
+        config.get_sync_folder_path.return_value = temp_directory / "Kindle Sync"
+        callback = Mock()
+        return ObsidianFileHandler(config, callback), callback
+
+    @pytest.fixture(autouse=True)
+    def _reset_handler(self, handler_and_callback):
+        """Clear the shared handler's state between tests."""
+        handler, callback = handler_and_callback
+        callback.reset_mock(side_effect=True)
+        yield
+        handler.stop()
+        handler.processed_files.clear()
+        handler._last_processed.clear()
+        handler._processed_signatures.clear()
+
+    def test_should_process_file_markdown(self, handler_and_callback, temp_directory):
+        """Test that markdown files in the vault are processed."""
+        handler, _ = handler_and_callback
+        test_file = temp_directory / "note.md"
+        test_file.touch()
+
+        assert handler._should_process_file(test_file) is True
+
+    def test_should_process_file_unsupported(
+        self, handler_and_callback, temp_directory
+    ):
+        """Test that files not matching the patterns are skipped."""
+        handler, _ = handler_and_callback
+
+        assert handler._should_process_file(temp_directory / "notes.txt") is False
+
+    @pytest.mark.parametrize(
+        "size,expected",
+        [(1024 * 1024, True), (60 * 1024 * 1024, False)],
+        ids=["under_limit", "too_large"],
+    )
+    def test_should_process_file_size_limit(
+        self, handler_and_callback, temp_directory, size, expected
+    ):
+        """Test the max_file_size check without writing large files."""
+        handler, _ = handler_and_callback
+        large_file = temp_directory / "large.md"
+
+        with patch.object(Path, "stat", return_value=Mock(st_size=size)):
+            assert handler._should_process_file(large_file) is expected
+
+    @pytest.mark.parametrize(
+        "size_str,expected",
+        [
+            ("1024", 1024),
+            ("1KB", 1024),
+            ("1mb", 1024 * 1024),
+            ("2MB", 2 * 1024 * 1024),
+            ("1GB", 1024 * 1024 * 1024),
+        ],
+    )
+    def test_parse_size(self, handler_and_callback, size_str, expected):
+        """Test parsing of max_file_size strings."""
+        handler, _ = handler_and_callback
+        assert handler._parse_size(size_str) == expected
+
+    def test_on_created_ignores_directories(self, handler_and_callback, temp_directory):
+        """Test that directory events never schedule processing."""
+        handler, callback = handler_and_callback
+        mock_event = Mock(
+            spec_set=FileCreatedEvent(""),
+            src_path=str(temp_directory / "folder.md"),
+            is_directory=True,
+        )
+
+        handler.on_created(mock_event)
+
+        assert handler.pending_files == {}
+        callback.assert_not_called()
+
+    def test_schedule_processing(self, handler_and_callback, temp_directory):
+        """Test that the first event runs at once and the rest are coalesced."""
+        handler, callback = handler_and_callback
+        handler.debounce_time = 60.0
+        leading = threading.Event()
+        callback.side_effect = lambda _: leading.set()
+        # Freshly written, as after a real save
+        test_file = temp_directory / "note.md"
+        test_file.write_text("saved")
+
+        try:
+            handler._schedule_processing(test_file)
+
+            # The leading run happens on the worker, not the observer thread,
+            # and does not wait for the debounce time
+            assert leading.wait(timeout=1)
+            callback.assert_called_once_with(test_file)
+
+            for _ in range(3):
+                handler._schedule_processing(test_file)
+
+            callback.assert_called_once_with(test_file)
+            assert list(handler.pending_files) == [test_file]
+        finally:
+            handler.debounce_time = _CONFIG_MAP["advanced.debounce_time"]
+
+    def test_rapid_events_reuse_one_worker(self, handler_and_callback, temp_directory):
+        """Test that a burst of events does not start a thread per event."""
+        handler, _ = handler_and_callback
+        handler.debounce_time = 60.0
+        threads_before = threading.active_count()
+        files = {temp_directory / f"burst{i}.md" for i in range(10)}
+
+        try:
+            for i in range(1000):
+                handler._schedule_processing(temp_directory / f"burst{i % 10}.md")
+
+            assert threading.active_count() <= threads_before + 1
+            assert set(handler.pending_files) <= files
+        finally:
+            handler.debounce_time = _CONFIG_MAP["advanced.debounce_time"]
+
+    def _wait_until_idle(self, handler):
+        """Wait for the worker to drain the queue, then stop it."""
+        for _ in range(500):
+            with handler._pending_cv:
+                if not handler.pending_files:
+                    break
+            threading.Event().wait(0.01)
+        handler.stop()
+
+    def test_debounced_file_is_processed(self, handler_and_callback, temp_directory):
+        """Test that a file changed after the leading run gets a trailing run."""
+        handler, callback = handler_and_callback
+        runs = threading.Semaphore(0)
+        callback.side_effect = lambda _: runs.release()
+        test_file = temp_directory / "done.md"
+        test_file.write_text("draft")
+        os.utime(test_file, (0, 0))
+
+        handler._schedule_processing(test_file)
+        assert runs.acquire(timeout=5)
+        test_file.write_text("final")
+        os.utime(test_file, (1, 1))
+        handler._schedule_processing(test_file)
+
+        assert runs.acquire(timeout=5)
+        assert callback.call_count == 2
+        assert handler.pending_files == {}
+
+    def test_created_then_modified_runs_once(
+        self, handler_and_callback, temp_directory
+    ):
+        """Test that the created + modified pair of one save is processed once."""
+        handler, callback = handler_and_callback
+        test_file = temp_directory / "saved.md"
+        test_file.write_text("content")
+        os.utime(test_file, (0, 0))
+
+        handler.on_created(
+            Mock(
+                spec_set=FileCreatedEvent(""),
+                src_path=str(test_file),
+                is_directory=False,
+            )
+        )
+        handler.on_modified(
+            Mock(
+                spec_set=FileModifiedEvent(""),
+                src_path=str(test_file),
+                is_directory=False,
+            )
+        )
+        self._wait_until_idle(handler)
+
+        callback.assert_called_once_with(test_file)
+
+    def test_recently_modified_file_is_deferred(
+        self, handler_and_callback, temp_directory
+    ):
+        """Test that a trailing run waits for a file being written to settle."""
+        handler, callback = handler_and_callback
+        processed = threading.Event()
+        ages = []
+
+        def record_age(path):
+            ages.append(time.time() - path.stat().st_mtime)
+            processed.set()
+
+        callback.side_effect = record_age
+        test_file = temp_directory / "writing.md"
+        test_file.write_text("half written")
+        handler._last_processed[test_file] = time.monotonic()
+
+        handler._schedule_processing(test_file)
+
+        assert processed.wait(timeout=5)
+        callback.assert_called_once_with(test_file)
+        assert ages[0] >= handler.debounce_time
+
+    def test_deleted_file_is_forgotten(self, handler_and_callback, temp_directory):
+        """Test that per-file bookkeeping is dropped once the file is gone."""
+        handler, callback = handler_and_callback
+        test_file = temp_directory / "gone.md"
+        handler._last_processed[test_file] = 0.0
+        handler._processed_signatures[test_file] = (0, 0)
+
+        handler._process_file(test_file)
 
-        # Should only process once due to debouncing
-        assert file_watcher.file_processor.process_file.call_count <= 1
+        callback.assert_not_called()
+        assert test_file not in handler._last_processed
+        assert test_file not in handler._processed_signatures
@@ -4,15 +4,32 @@ Unit tests for HealthChecker.
 Tests the health check functionality for system components.
 """
 
-import tempfile
+from contextlib import ExitStack
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
 from pathlib import Path
 
-from src.config import Config
 from src.database.manager import DatabaseManager
 from src.monitoring.health_checks import HealthChecker
+from tests.fixtures.mock_objects import StubConfig
+
+_CONFIG_MAP = MappingProxyType({"obsidian.watch_subfolders": True})
+
+
+# Every check run_all_checks registers, mapped to a passing (status, message)
+_HEALTHY_CHECKS = {
+    "filesystem": ("healthy", "Filesystem accessible"),
+    "configuration": ("healthy", "Configuration valid"),
+    "database": ("healthy", "Database connected"),
+    "memory": ("healthy", "Memory usage normal"),
+    "disk_space": ("healthy", "Disk space available"),
+    "config_paths": ("healthy", "All paths accessible"),
+    "database_connection": ("healthy", "Database connected"),
+    "email_service_config": ("healthy", "Email configured"),
+    "temp_directory_access": ("healthy", "Temp directory accessible"),
+}
 
 
 class TestHealthChecker:
@@ -20,12 +37,16 @@ class TestHealthChecker:
 
     @pytest.fixture
     def mock_config(self):
-        """Create a mock configuration."""
-        config = Mock(spec=Config)
-        config.get.side_effect = lambda key, default=None: {
-            "obsidian.watch_subfolders": True
-        }.get(key, default)
-        return config
+        """Create a config stub."""
+        return StubConfig(
+            _CONFIG_MAP,
+            "get_obsidian_vault_path",
+            "get_sync_folder_path",
+            "get_backup_folder_path",
+            "get_smtp_config",
+            "get_kindle_email",
+            validate=True,
+        )
 
     @pytest.fixture
     def mock_db_manager(self):
@@ -46,174 +67,91 @@ class TestHealthChecker:
         assert health_checker.db_manager == mock_db_manager
 
     @pytest.mark.asyncio
-    async def test_run_all_checks_success(
-        self, health_checker, mock_config, mock_db_manager
+    @pytest.mark.parametrize(
+        "overrides,expected_overall,expected_failures,expected_message",
+        [
+            ({}, "healthy", {}, None),
+            (
+                {
+                    "config_paths": ("unhealthy", "Paths not accessible"),
+                    "email_service_config": ("unhealthy", "Email not configured"),
+                },
+                "unhealthy",
+                {"config_paths": "unhealthy", "email_service_config": "unhealthy"},
+                None,
+            ),
+            (
+                {"config_paths": Exception("Test exception")},
+                "unhealthy",
+                {"config_paths": "error"},
+                "Test exception",
+            ),
+        ],
+        ids=["success", "with_failures", "with_exception"],
+    )
+    async def test_run_all_checks(
+        self,
+        health_checker,
+        overrides,
+        expected_overall,
+        expected_failures,
+        expected_message,
     ):
-        """Test running all health checks successfully."""
-        # Mock all check methods to return healthy status
-        with patch.object(
-            health_checker,
-            "_check_filesystem",
-            return_value=("healthy", "Filesystem accessible"),
-        ), patch.object(
-            health_checker,
-            "_check_configuration",
-            return_value=("healthy", "Configuration valid"),
-        ), patch.object(
-            health_checker,
-            "_check_database",
-            return_value=("healthy", "Database connected"),
-        ), patch.object(
-            health_checker,
-            "_check_memory",
-            return_value=("healthy", "Memory usage normal"),
-        ), patch.object(
-            health_checker,
-            "_check_disk_space",
-            return_value=("healthy", "Disk space available"),
-        ), patch.object(
-            health_checker,
-            "_check_config_paths",
-            return_value=("healthy", "All paths accessible"),
-        ), patch.object(
-            health_checker,
-            "_check_database_connection",
-            return_value=("healthy", "Database connected"),
-        ), patch.object(
-            health_checker,
-            "_check_email_service_config",
-            return_value=("healthy", "Email configured"),
-        ), patch.object(
-            health_checker,
-            "_check_temp_directory_access",
-            return_value=("healthy", "Temp directory accessible"),
-        ):
-            results = await health_checker.run_all_checks()
+        """Test the overall status built from the individual checks."""
+        with ExitStack() as stack:
+            for name, healthy_result in _HEALTHY_CHECKS.items():
+                outcome = overrides.get(name, healthy_result)
+                kwargs = (
+                    {"side_effect": outcome}
+                    if isinstance(outcome, Exception)
+                    else {"return_value": outcome}
+                )
+                stack.enter_context(
+                    patch.object(health_checker, f"_check_{name}", **kwargs)
+                )
 
-            assert results["overall_status"] == "healthy"
-            assert len(results["checks"]) == 9
-
-            for check_name, check_result in results["checks"].items():
-                assert check_result["status"] == "healthy"
-                assert "message" in check_result
-
-    @pytest.mark.asyncio
-    async def test_run_all_checks_with_failures(
-        self, health_checker, mock_config, mock_db_manager
-    ):
-        """Test running all health checks with some failures."""
-        # Mock some checks to fail
-        with patch.object(
-            health_checker,
-            "_check_filesystem",
-            return_value=("healthy", "Filesystem accessible"),
-        ), patch.object(
-            health_checker,
-            "_check_configuration",
-            return_value=("healthy", "Configuration valid"),
-        ), patch.object(
-            health_checker,
-            "_check_database",
-            return_value=("healthy", "Database connected"),
-        ), patch.object(
-            health_checker,
-            "_check_memory",
-            return_value=("healthy", "Memory usage normal"),
-        ), patch.object(
-            health_checker,
-            "_check_disk_space",
-            return_value=("healthy", "Disk space available"),
-        ), patch.object(
-            health_checker,
-            "_check_config_paths",
-            return_value=("unhealthy", "Paths not accessible"),
-        ), patch.object(
-            health_checker,
-            "_check_database_connection",
-            return_value=("healthy", "Database connected"),
-        ), patch.object(
-            health_checker,
-            "_check_email_service_config",
-            return_value=("unhealthy", "Email not configured"),
-        ), patch.object(
-            health_checker,
-            "_check_temp_directory_access",
-            return_value=("healthy", "Temp directory accessible"),
-        ):
             results = await health_checker.run_all_checks()
 
-            assert results["overall_status"] == "unhealthy"
-            assert results["checks"]["config_paths"]["status"] == "unhealthy"
-            assert results["checks"]["database_connection"]["status"] == "healthy"
-            assert results["checks"]["email_service_config"]["status"] == "unhealthy"
-            assert results["checks"]["temp_directory_access"]["status"] == "healthy"
-
-    @pytest.mark.asyncio
-    async def test_run_all_checks_with_exception(
-        self, health_checker, mock_config, mock_db_manager
+        assert results["overall_status"] == expected_overall
+        assert {
+            name: check_result["status"]
+            for name, check_result in results["checks"].items()
+        } == {name: "healthy" for name in _HEALTHY_CHECKS} | expected_failures
+        for check_result in results["checks"].values():
+            assert "message" in check_result
+        if expected_message:
+            assert expected_message in results["checks"]["config_paths"]["message"]
+
+    @pytest.mark.parametrize(
+        "backup_folder,expected_status,expected_message",
+        [
+            ("backup", "healthy", "All configured paths are accessible"),
+            # Absolute, so joining it to tmp_path leaves it unchanged
+            ("/root/backup", "unhealthy", "not creatable"),
+        ],
+        ids=["success", "backup_folder_creation_failure"],
+    )
+    def test_check_config_paths(
+        self,
+        health_checker,
+        mock_config,
+        tmp_path,
+        backup_folder,
+        expected_status,
+        expected_message,
     ):
-        """Test running all health checks with an exception."""
-        # Mock a check to raise an exception
-        with patch.object(
-            health_checker,
-            "_check_filesystem",
-            return_value=("healthy", "Filesystem accessible"),
-        ), patch.object(
-            health_checker,
-            "_check_configuration",
-            return_value=("healthy", "Configuration valid"),
-        ), patch.object(
-            health_checker,
-            "_check_database",
-            return_value=("healthy", "Database connected"),
-        ), patch.object(
-            health_checker,
-            "_check_memory",
-            return_value=("healthy", "Memory usage normal"),
-        ), patch.object(
-            health_checker,
-            "_check_disk_space",
-            return_value=("healthy", "Disk space available"),
-        ), patch.object(
-            health_checker,
-            "_check_config_paths",
-            side_effect=Exception("Test exception"),
-        ), patch.object(
-            health_checker,
-            "_check_database_connection",
-            return_value=("healthy", "Database connected"),
-        ), patch.object(
-            health_checker,
-            "_check_email_service_config",
-            return_value=("healthy", "Email configured"),
-        ), patch.object(
-            health_checker,
-            "_check_temp_directory_access",
-            return_value=("healthy", "Temp directory accessible"),
-        ):
-            results = await health_checker.run_all_checks()
-
-            assert results["overall_status"] == "unhealthy"
-            assert results["checks"]["config_paths"]["status"] == "error"
-            assert "Test exception" in results["checks"]["config_paths"]["message"]
+        """Test config paths check as the backup folder gets created."""
+        mock_config.get_obsidian_vault_path.return_value = tmp_path
+        mock_config.get_sync_folder_path.return_value = tmp_path / "sync"
+        mock_config.get_backup_folder_path.return_value = tmp_path / backup_folder
 
-    def test_check_config_paths_success(self, health_checker, mock_config):
-        """Test successful config paths check."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Create the sync folder
+        (tmp_path / "sync").mkdir()
 
-            # Mock config methods to return existing paths
-            mock_config.get_obsidian_vault_path.return_value = temp_path
-            mock_config.get_sync_folder_path.return_value = temp_path / "sync"
-            mock_config.get_backup_folder_path.return_value = temp_path / "backup"
-
-            # Create the sync folder
-            (temp_path / "sync").mkdir()
-
-            status, message = health_checker._check_config_paths()
+        status, message = health_checker._check_config_paths()
 
-            assert status == "healthy"
-            assert "All configured paths are accessible" in message
+        assert status == expected_status
+        assert expected_message in message
 
     def test_check_config_paths_vault_not_exists(self, health_checker, mock_config):
         """Test config paths check when vault path doesn't exist."""
@@ -226,24 +164,23 @@ class TestHealthChecker:
         assert status == "unhealthy"
         assert "does not exist" in message
 
-    def test_check_config_paths_no_permission(self, health_checker, mock_config):
+    def test_check_config_paths_no_permission(
+        self, health_checker, mock_config, tmp_path
+    ):
         """Test config paths check when paths have no permission."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create a directory but make it non-writable
-            vault_dir = temp_path / "vault"
-            vault_dir.mkdir()
-            vault_dir.chmod(0o444)  # Read-only
+        # Create a directory but make it non-writable
+        vault_dir = tmp_path / "vault"
+        vault_dir.mkdir()
+        vault_dir.chmod(0o444)  # Read-only
 
-            mock_config.get_obsidian_vault_path.return_value = vault_dir
-            mock_config.get_sync_folder_path.return_value = temp_path / "sync"
-            mock_config.get_backup_folder_path.return_value = temp_path / "backup"
+        mock_config.get_obsidian_vault_path.return_value = vault_dir
+        mock_config.get_sync_folder_path.return_value = tmp_path / "sync"
+        mock_config.get_backup_folder_path.return_value = tmp_path / "backup"
 
-            status, message = health_checker._check_config_paths()
+        status, message = health_checker._check_config_paths()
 
-            assert status == "unhealthy"
-            assert "not readable/writable" in message
+        assert status == "unhealthy"
+        assert "not readable/writable" in message
 
     def test_check_database_connection_success(self, health_checker, mock_db_manager):
         """Test successful database connection check."""
@@ -269,135 +206,100 @@ class TestHealthChecker:
         assert status == "unhealthy"
         assert "Database connection failed" in message
 
-    def test_check_email_service_config_success(self, health_checker, mock_config):
-        """Test successful email service config check."""
-        # Mock complete email configuration
-        mock_config.get_smtp_config.return_value = {
-            "server": "smtp.gmail.com",
-            "username": "test@example.com",
-            "password": "password123",
-        }
-        mock_config.get_kindle_email.return_value = "kindle@example.com"
-
-        status, message = health_checker._check_email_service_config()
-
-        assert status == "healthy"
-        assert "Email service configuration is complete" in message
-
-    def test_check_email_service_config_incomplete_smtp(
-        self, health_checker, mock_config
+    @pytest.mark.parametrize(
+        "password,kindle_email,expected_status,expected_message",
+        [
+            (
+                "password123",
+                "kindle@example.com",
+                "healthy",
+                "Email service configuration is complete",
+            ),
+            (
+                "",
+                "kindle@example.com",
+                "unhealthy",
+                "Incomplete SMTP configuration",
+            ),
+            (
+                "password123",
+                "",
+                "unhealthy",
+                "Kindle email address not configured",
+            ),
+        ],
+        ids=["success", "incomplete_smtp", "missing_kindle_email"],
+    )
+    def test_check_email_service_config(
+        self,
+        health_checker,
+        mock_config,
+        password,
+        kindle_email,
+        expected_status,
+        expected_message,
     ):
-        """Test email service config check with incomplete SMTP config."""
-        # Mock incomplete SMTP configuration
+        """Test the email service config check outcomes."""
         mock_config.get_smtp_config.return_value = {
             "server": "smtp.gmail.com",
             "username": "test@example.com",
-            "password": "",  # Missing password
+            "password": password,
         }
-        mock_config.get_kindle_email.return_value = "kindle@example.com"
+        mock_config.get_kindle_email.return_value = kindle_email
 
         status, message = health_checker._check_email_service_config()
 
-        assert status == "unhealthy"
-        assert "Incomplete SMTP configuration" in message
+        assert status == expected_status
+        assert expected_message in message
 
-    def test_check_email_service_config_missing_kindle_email(
-        self, health_checker, mock_config
-    ):
-        """Test email service config check with missing Kindle email."""
-        # Mock complete SMTP but missing Kindle email
-        mock_config.get_smtp_config.return_value = {
-            "server": "smtp.gmail.com",
-            "username": "test@example.com",
-            "password": "password123",
-        }
-        mock_config.get_kindle_email.return_value = ""
-
-        status, message = health_checker._check_email_service_config()
-
-        assert status == "unhealthy"
-        assert "Kindle email address not configured" in message
-
-    def test_check_temp_directory_access_success(self, health_checker):
-        """Test successful temp directory access check."""
-        with patch("os.access", return_value=True), patch(
-            "pathlib.Path.exists", return_value=True
-        ), patch("pathlib.Path.write_text"), patch("pathlib.Path.unlink"):
-            status, message = health_checker._check_temp_directory_access()
-
-            assert status == "healthy"
-            assert "Temporary directory is accessible" in message
-
-    def test_check_temp_directory_access_not_accessible(self, health_checker):
-        """Test temp directory access check when not accessible."""
-        with patch("os.access", return_value=False), patch(
-            "pathlib.Path.exists", return_value=True
-        ):
-            status, message = health_checker._check_temp_directory_access()
-
-            assert status == "unhealthy"
-            assert "not accessible or writable" in message
-
-    def test_check_temp_directory_access_error(self, health_checker):
-        """Test temp directory access check with error."""
-        with patch("os.access", side_effect=OSError("Permission denied")):
-            status, message = health_checker._check_temp_directory_access()
-
-            assert status == "unhealthy"
-            assert "Error accessing temporary directory" in message
-
-    def test_check_temp_directory_access_file_creation_error(self, health_checker):
-        """Test temp directory access check with file creation error."""
-        with patch("os.access", return_value=True), patch(
+    @pytest.fixture
+    def fs_patches(self):
+        """Patch the filesystem calls made by the temp directory check."""
+        with patch("os.access", return_value=True) as access, patch(
             "pathlib.Path.exists", return_value=True
-        ), patch("pathlib.Path.write_text", side_effect=OSError("Write failed")):
-            status, message = health_checker._check_temp_directory_access()
-
-            assert status == "unhealthy"
-            assert "Error accessing temporary directory" in message
-
-    def test_check_config_paths_backup_folder_creation(
-        self, health_checker, mock_config
-    ):
-        """Test config paths check with backup folder creation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Mock config methods
-            mock_config.get_obsidian_vault_path.return_value = temp_path
-            mock_config.get_sync_folder_path.return_value = temp_path / "sync"
-            mock_config.get_backup_folder_path.return_value = temp_path / "backup"
-
-            # Create the sync folder
-            (temp_path / "sync").mkdir()
-
-            # Backup folder doesn't exist initially
-            assert not (temp_path / "backup").exists()
-
-            status, message = health_checker._check_config_paths()
-
-            assert status == "healthy"
-            # Backup folder should be created and then removed during the test
-            assert "All configured paths are accessible" in message
-
-    def test_check_config_paths_backup_folder_creation_failure(
-        self, health_checker, mock_config
+        ), patch("pathlib.Path.write_text") as write_text, patch("pathlib.Path.unlink"):
+            yield access, write_text
+
+    @pytest.mark.parametrize(
+        "access_kwargs,write_error,expected_status,expected_message",
+        [
+            ({}, None, "healthy", "Temporary directory is accessible"),
+            (
+                {"return_value": False},
+                None,
+                "unhealthy",
+                "not accessible or writable",
+            ),
+            (
+                {"side_effect": OSError("Permission denied")},
+                None,
+                "unhealthy",
+                "Error accessing temporary directory",
+            ),
+            (
+                {},
+                OSError("Write failed"),
+                "unhealthy",
+                "Error accessing temporary directory",
+            ),
+        ],
+        ids=["success", "not_accessible", "error", "file_creation_error"],
+    )
+    def test_check_temp_directory_access(
+        self,
+        health_checker,
+        fs_patches,
+        access_kwargs,
+        write_error,
+        expected_status,
+        expected_message,
     ):
-        """Test config paths check with backup folder creation failure."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Mock config methods
-            mock_config.get_obsidian_vault_path.return_value = temp_path
-            mock_config.get_sync_folder_path.return_value = temp_path / "sync"
-            mock_config.get_backup_folder_path.return_value = Path(
-                "/root/backup"
-            )  # Unwritable path
-
-            # Create the sync folder
-            (temp_path / "sync").mkdir()
+        """Test the temp directory access check outcomes."""
+        access, write_text = fs_patches
+        access.configure_mock(**access_kwargs)
+        write_text.side_effect = write_error
 
-            status, message = health_checker._check_config_paths()
+        status, message = health_checker._check_temp_directory_access()
 
-            assert status == "unhealthy"
-            assert "not creatable" in message
+        assert status == expected_status
+        assert expected_message in message
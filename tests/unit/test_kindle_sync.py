@@ -1,38 +1,43 @@
 """Unit tests for Kindle synchronization functionality."""
 
+import os
 from email.mime.multipart import MIMEMultipart
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
-from pathlib import Path
 
 from src.core.exceptions import EmailServiceError, FileProcessingError
 from src.kindle_sync import KindleSync
 
 
+@pytest.fixture(scope="module")
+def canonical_pdf(tmp_path_factory, sample_pdf_content):
+    """Write the sample PDF once; KindleSync only ever reads its source file."""
+    pdf_file = tmp_path_factory.mktemp("pdfs") / "test.pdf"
+    pdf_file.write_bytes(sample_pdf_content)
+    return pdf_file
+
+
 class TestKindleSync:
     """Test cases for KindleSync class."""
 
-    def test_kindle_sync_initialization(self, config):
-        """Test KindleSync initialization."""
-        kindle_sync = KindleSync(config)
+    @pytest.fixture
+    def kindle_sync(self, config):
+        """Create a KindleSync instance; function-scoped as tests mutate it."""
+        return KindleSync(config)
 
+    def test_kindle_sync_initialization(self, config, kindle_sync):
+        """Test KindleSync initialization."""
         assert kindle_sync.config == config
         assert kindle_sync.kindle_email == config.get_kindle_email()
         assert kindle_sync.smtp_config == config.get_smtp_config()
         assert kindle_sync.sync_config == config.get_sync_config()
 
-    def test_send_pdf_to_kindle_success(self, config, temp_dir, sample_pdf_content):
+    def test_send_pdf_to_kindle_success(self, kindle_sync, canonical_pdf):
         """Test successful PDF sending to Kindle."""
-        kindle_sync = KindleSync(config)
-
-        # Create a PDF file
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(sample_pdf_content)
-
         # Mock SMTP
         with patch.object(kindle_sync, "_send_email_with_retry") as mock_send:
-            result = kindle_sync.send_pdf_to_kindle(pdf_file)
+            result = kindle_sync.send_pdf_to_kindle(canonical_pdf)
 
             assert result is True
             mock_send.assert_called_once()
@@ -43,21 +48,13 @@ class TestKindleSync:
             assert email_msg["To"] == "test@kindle.com"
             assert email_msg["Subject"] == "Document: test"
 
-    def test_send_pdf_to_kindle_custom_subject(
-        self, config, temp_dir, sample_pdf_content
-    ):
+    def test_send_pdf_to_kindle_custom_subject(self, kindle_sync, canonical_pdf):
         """Test PDF sending with custom subject."""
-        kindle_sync = KindleSync(config)
-
-        # Create a PDF file
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(sample_pdf_content)
-
         custom_subject = "Custom Document Title"
 
         # Mock SMTP
         with patch.object(kindle_sync, "_send_email_with_retry") as mock_send:
-            result = kindle_sync.send_pdf_to_kindle(pdf_file, custom_subject)
+            result = kindle_sync.send_pdf_to_kindle(canonical_pdf, custom_subject)
 
             assert result is True
 
@@ -65,82 +62,66 @@ class TestKindleSync:
             email_msg = mock_send.call_args[0][0]
             assert email_msg["Subject"] == custom_subject
 
-    def test_send_pdf_to_kindle_file_not_found(self, config, temp_dir):
+    def test_send_pdf_to_kindle_file_not_found(self, kindle_sync, temp_dir):
         """Test PDF sending with non-existent file."""
-        kindle_sync = KindleSync(config)
-
         non_existent_file = temp_dir / "non_existent.pdf"
 
         with pytest.raises(EmailServiceError):
             kindle_sync.send_pdf_to_kindle(non_existent_file)
 
-    def test_send_pdf_to_kindle_smtp_error(self, config, temp_dir, sample_pdf_content):
+    def test_send_pdf_to_kindle_smtp_error(self, kindle_sync, canonical_pdf):
         """Test PDF sending with SMTP error."""
-        kindle_sync = KindleSync(config)
-
-        # Create a PDF file
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(sample_pdf_content)
-
         # Mock SMTP to raise exception
         with patch.object(
             kindle_sync, "_send_email_with_retry", side_effect=Exception("SMTP error")
         ):
             with pytest.raises(EmailServiceError):
-                kindle_sync.send_pdf_to_kindle(pdf_file)
-
-    def test_send_email_success(self, config):
-        """Test successful email sending."""
-        kindle_sync = KindleSync(config)
+                kindle_sync.send_pdf_to_kindle(canonical_pdf)
 
-        # Create a test email
+    @pytest.fixture
+    def email_msg(self):
+        """Create a minimal outgoing email."""
         msg = MIMEMultipart()
         msg["From"] = "test@gmail.com"
         msg["To"] = "test@kindle.com"
         msg["Subject"] = "Test Subject"
+        return msg
 
-        # Mock SMTP
-        with patch("smtplib.SMTP") as mock_smtp_class:
-            mock_server = Mock()
-            mock_smtp_class.return_value = mock_server
+    @pytest.fixture
+    def mock_smtp_class(self):
+        """Patch smtplib.SMTP for the duration of a test."""
+        with patch("smtplib.SMTP") as smtp_class:
+            yield smtp_class
 
-            kindle_sync._send_email_with_retry(msg)
+    def test_send_email_success(self, kindle_sync, email_msg, mock_smtp_class):
+        """Test successful email sending."""
+        mock_server = mock_smtp_class.return_value
 
-            # Verify SMTP operations
-            mock_smtp_class.assert_called_once_with("smtp.gmail.com", 587)
-            mock_server.starttls.assert_called_once()
-            mock_server.login.assert_called_once_with("test@gmail.com", "test_password")
-            mock_server.sendmail.assert_called_once()
-            mock_server.quit.assert_called_once()
+        kindle_sync._send_email_with_retry(email_msg)
 
-    def test_send_email_smtp_error(self, config):
-        """Test email sending with SMTP error."""
-        kindle_sync = KindleSync(config)
+        # Verify SMTP operations
+        mock_smtp_class.assert_called_once_with("smtp.gmail.com", 587)
+        mock_server.starttls.assert_called_once()
+        mock_server.login.assert_called_once_with("test@gmail.com", "test_password")
+        mock_server.sendmail.assert_called_once()
+        mock_server.quit.assert_called_once()
 
-        # Create a test email
-        msg = MIMEMultipart()
-        msg["From"] = "test@gmail.com"
-        msg["To"] = "test@kindle.com"
-        msg["Subject"] = "Test Subject"
+    def test_send_email_smtp_error(self, kindle_sync, email_msg, mock_smtp_class):
+        """Test email sending with SMTP error."""
+        mock_smtp_class.side_effect = Exception("SMTP connection error")
 
-        # Mock SMTP to raise exception
-        with patch("smtplib.SMTP", side_effect=Exception("SMTP connection error")):
-            with pytest.raises(Exception, match="SMTP connection error"):
-                kindle_sync._send_email_with_retry(msg)
+        with pytest.raises(Exception, match="SMTP connection error"):
+            kindle_sync._send_email_with_retry(email_msg)
 
-    def test_copy_to_kindle_usb_success(self, config, temp_dir, sample_pdf_content):
+    def test_copy_to_kindle_usb_success(
+        self, kindle_sync, canonical_pdf, temp_dir, sample_pdf_content
+    ):
         """Test successful USB copy to Kindle."""
-        kindle_sync = KindleSync(config)
-
-        # Create a PDF file
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(sample_pdf_content)
-
         # Create mock Kindle path
         kindle_path = temp_dir / "kindle_documents"
         kindle_path.mkdir()
 
-        result = kindle_sync.copy_to_kindle_usb(pdf_file, kindle_path)
+        result = kindle_sync.copy_to_kindle_usb(canonical_pdf, kindle_path)
 
         assert result is True
 
@@ -149,34 +130,22 @@ class TestKindleSync:
         assert destination.exists()
         assert destination.read_bytes() == sample_pdf_content
 
-    def test_copy_to_kindle_usb_default_path_linux(
-        self, config, temp_dir, sample_pdf_content
+    def test_copy_to_kindle_usb_default_path(
+        self, kindle_sync, canonical_pdf, temp_dir
     ):
-        """Test USB copy with default Linux Kindle path."""
-        kindle_sync = KindleSync(config)
-
-        # Create a PDF file
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(sample_pdf_content)
-
-        # Create mock default Kindle path
-        default_kindle_path = Path("/media/Kindle/documents")
-
-        with patch("pathlib.Path.exists") as mock_exists:
-            mock_exists.side_effect = lambda: str(default_kindle_path) in str(
-                Path.cwd()
-            ) or str(default_kindle_path) == str(default_kindle_path)
+        """Test USB copy falls back to the first mounted default Kindle path."""
+        kindle_path = temp_dir / "kindle_documents"
+        kindle_path.mkdir()
+        default_paths = (temp_dir / "not_mounted", kindle_path)
 
-            with patch("shutil.copy2") as mock_copy:
-                kindle_sync.copy_to_kindle_usb(pdf_file)
+        with patch("src.kindle_sync._DEFAULT_KINDLE_PATHS", default_paths):
+            result = kindle_sync.copy_to_kindle_usb(canonical_pdf)
 
-                # Should attempt to copy (even if path doesn't exist in test)
-                mock_copy.assert_called()
+        assert result is True
+        assert (kindle_path / canonical_pdf.name).exists()
 
-    def test_copy_to_kindle_usb_file_not_found(self, config, temp_dir):
+    def test_copy_to_kindle_usb_file_not_found(self, kindle_sync, temp_dir):
         """Test USB copy with non-existent file."""
-        kindle_sync = KindleSync(config)
-
         non_existent_file = temp_dir / "non_existent.pdf"
         kindle_path = temp_dir / "kindle_documents"
         kindle_path.mkdir()
@@ -186,87 +155,58 @@ class TestKindleSync:
         assert result is False
 
     def test_copy_to_kindle_usb_kindle_path_not_found(
-        self, config, temp_dir, sample_pdf_content
+        self, kindle_sync, canonical_pdf, temp_dir
     ):
         """Test USB copy with non-existent Kindle path."""
-        kindle_sync = KindleSync(config)
-
-        # Create a PDF file
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(sample_pdf_content)
-
         non_existent_kindle_path = temp_dir / "non_existent_kindle"
 
-        result = kindle_sync.copy_to_kindle_usb(pdf_file, non_existent_kindle_path)
+        result = kindle_sync.copy_to_kindle_usb(canonical_pdf, non_existent_kindle_path)
 
         assert result is False
 
-    def test_backup_file_success(self, config, temp_dir, sample_pdf_content):
+    def test_backup_file_success(
+        self, kindle_sync, canonical_pdf, temp_dir, sample_pdf_content
+    ):
         """Test successful file backup."""
-        kindle_sync = KindleSync(config)
-
-        # Create a file to backup
-        original_file = temp_dir / "test.pdf"
-        original_file.write_bytes(sample_pdf_content)
-
-        # Create backup folder
+        # sync_config is read at construction, so point it at this test's dir
         backup_folder = temp_dir / "Backups"
-        backup_folder.mkdir(exist_ok=True)
+        kindle_sync.sync_config = {
+            "backup_originals": True,
+            "backup_folder": str(backup_folder),
+        }
 
-        with patch.object(
-            kindle_sync.config,
-            "get_sync_config",
-            return_value={
-                "backup_originals": True,
-                "backup_folder": str(backup_folder),
-            },
-        ):
-            result = kindle_sync.backup_file(original_file)
+        result = kindle_sync.backup_file(canonical_pdf)
 
-            assert result is not None
-            assert result.exists()
-            assert result.read_bytes() == sample_pdf_content
-            assert "test_" in result.name
-            assert result.suffix == ".pdf"
+        assert result is not None
+        assert result.parent == backup_folder
+        assert result.read_bytes() == sample_pdf_content
+        assert "test_" in result.name
+        assert result.suffix == ".pdf"
 
-    def test_backup_file_disabled(self, config, temp_dir, sample_pdf_content):
+    def test_backup_file_disabled(self, kindle_sync, canonical_pdf):
         """Test file backup when disabled."""
-        kindle_sync = KindleSync(config)
-
-        # Create a file to backup
-        original_file = temp_dir / "test.pdf"
-        original_file.write_bytes(sample_pdf_content)
-
         # Mock the sync_config to disable backups
         kindle_sync.sync_config = {
             "backup_originals": False,
             "backup_folder": "Backups",
         }
-        result = kindle_sync.backup_file(original_file)
+        result = kindle_sync.backup_file(canonical_pdf)
 
         assert result is None
 
-    def test_backup_file_error(self, config, temp_dir, sample_pdf_content):
+    def test_backup_file_error(self, kindle_sync, canonical_pdf, temp_dir):
         """Test file backup with error."""
-        kindle_sync = KindleSync(config)
-
-        # Create a file to backup
-        original_file = temp_dir / "test.pdf"
-        original_file.write_bytes(sample_pdf_content)
+        kindle_sync.sync_config = {
+            "backup_originals": True,
+            "backup_folder": str(temp_dir / "Backups"),
+        }
 
-        with patch.object(
-            kindle_sync.config,
-            "get_sync_config",
-            return_value={"backup_originals": True, "backup_folder": "/invalid/path"},
-        ):
-            with patch("shutil.copy2", side_effect=Exception("Copy error")):
-                with pytest.raises(FileProcessingError):
-                    kindle_sync.backup_file(original_file)
+        with patch("shutil.copy2", side_effect=Exception("Copy error")):
+            with pytest.raises(FileProcessingError):
+                kindle_sync.backup_file(canonical_pdf)
 
-    def test_get_kindle_documents_success(self, config, temp_dir):
+    def test_get_kindle_documents_success(self, kindle_sync, temp_dir):
         """Test getting Kindle documents successfully."""
-        kindle_sync = KindleSync(config)
-
         # Create mock Kindle documents folder
         kindle_path = temp_dir / "kindle_documents"
         kindle_path.mkdir()
@@ -283,29 +223,23 @@ class TestKindleSync:
         assert pdf1 in result
         assert pdf2 in result
 
-    def test_get_kindle_documents_path_not_found(self, config, temp_dir):
+    def test_get_kindle_documents_path_not_found(self, kindle_sync, temp_dir):
         """Test getting Kindle documents with non-existent path."""
-        kindle_sync = KindleSync(config)
-
         non_existent_path = temp_dir / "non_existent"
 
         result = kindle_sync.get_kindle_documents(non_existent_path)
 
         assert result == []
 
-    def test_get_kindle_documents_default_paths(self, config):
+    def test_get_kindle_documents_default_paths(self, kindle_sync, temp_dir):
         """Test getting Kindle documents with default paths."""
-        kindle_sync = KindleSync(config)
-
-        with patch("pathlib.Path.exists", return_value=False):
+        with patch("src.kindle_sync._DEFAULT_KINDLE_PATHS", (temp_dir / "nope",)):
             result = kindle_sync.get_kindle_documents()
 
-            assert result == []
+        assert result == []
 
-    def test_sync_from_kindle_success(self, config, temp_dir):
+    def test_sync_from_kindle_success(self, kindle_sync, temp_dir):
         """Test successful sync from Kindle."""
-        kindle_sync = KindleSync(config)
-
         # Create mock Kindle documents
         kindle_path = temp_dir / "kindle_documents"
         kindle_path.mkdir()
@@ -328,10 +262,8 @@ class TestKindleSync:
                 assert result[0].exists()
                 assert result[0].read_bytes() == b"PDF1"
 
-    def test_sync_from_kindle_file_exists(self, config, temp_dir):
+    def test_sync_from_kindle_file_exists(self, kindle_sync, temp_dir):
         """Test sync from Kindle when file already exists."""
-        kindle_sync = KindleSync(config)
-
         # Create mock Kindle documents
         kindle_path = temp_dir / "kindle_documents"
         kindle_path.mkdir()
@@ -355,15 +287,13 @@ class TestKindleSync:
                 assert len(result) == 0
                 assert existing_file.read_bytes() == b"Existing PDF"
 
-    def test_cleanup_old_files_success(self, config, temp_dir):
+    def test_cleanup_old_files_success(self, kindle_sync, temp_dir):
         """Test successful cleanup of old files."""
-        kindle_sync = KindleSync(config)
-
         # Create test folder with files
         test_folder = temp_dir / "test_folder"
         test_folder.mkdir()
 
-        # Create old file (simulate old timestamp)
+        # Create old file
         old_file = test_folder / "old_file.txt"
         old_file.write_text("Old content")
 
@@ -371,41 +301,17 @@ class TestKindleSync:
         recent_file = test_folder / "recent_file.txt"
         recent_file.write_text("Recent content")
 
-        # Mock the cleanup method to test the logic
-        def mock_cleanup_old_files(folder, max_age_days=30):
-            import time
-
-            cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
-            cleaned_count = 0
-
-            for file_path in folder.iterdir():
-                if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
-                    file_path.unlink()
-                    cleaned_count += 1
+        # Backdate the old file well past the 30 day cutoff
+        os.utime(old_file, (1000000000, 1000000000))
 
-            return cleaned_count
+        result = kindle_sync.cleanup_old_files(test_folder, max_age_days=30)
 
-        # Mock the method
-        with patch.object(
-            kindle_sync, "cleanup_old_files", side_effect=mock_cleanup_old_files
-        ):
-            with patch("time.time", return_value=2000000000):  # Current time
-                # Manually set file timestamps
-                import os
-
-                os.utime(old_file, (1000000000, 1000000000))  # Old timestamp
-                os.utime(recent_file, (2000000000, 2000000000))  # Recent timestamp
-
-                result = kindle_sync.cleanup_old_files(test_folder, max_age_days=30)
+        assert result == 1  # One file cleaned up
+        assert not old_file.exists()
+        assert recent_file.exists()
 
-                assert result == 1  # One file cleaned up
-                assert not old_file.exists()
-                assert recent_file.exists()
-
-    def test_cleanup_old_files_error(self, config, temp_dir):
+    def test_cleanup_old_files_error(self, kindle_sync, temp_dir):
         """Test cleanup with error."""
-        kindle_sync = KindleSync(config)
-
         # Create test folder
         test_folder = temp_dir / "test_folder"
         test_folder.mkdir()
@@ -420,18 +326,14 @@ class TestKindleSync:
 
             assert result == 0
 
-    def test_smtp_configuration_usage(self, config):
+    def test_smtp_configuration_usage(self, kindle_sync):
         """Test that SMTP configuration is used correctly."""
-        kindle_sync = KindleSync(config)
-
         # Verify SMTP config is properly set
         assert kindle_sync.smtp_config["server"] == "smtp.gmail.com"
         assert kindle_sync.smtp_config["port"] == 587
         assert kindle_sync.smtp_config["username"] == "test@gmail.com"
         assert kindle_sync.smtp_config["password"] == "test_password"
 
-    def test_kindle_email_usage(self, config):
+    def test_kindle_email_usage(self, kindle_sync):
         """Test that Kindle email is used correctly."""
-        kindle_sync = KindleSync(config)
-
         assert kindle_sync.kindle_email == "test@kindle.com"
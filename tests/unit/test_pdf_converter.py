@@ -4,15 +4,55 @@ Unit tests for PDF converter functionality.
 Tests the PDF conversion between Markdown and PDF formats.
 """
 
-import tempfile
-from unittest.mock import Mock, patch
+import os
+import sys
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from pathlib import Path
 
-from src.config import Config
 from src.core.exceptions import ErrorSeverity, FileProcessingError
-from src.pdf_converter import MarkdownToPDFConverter, PDFToMarkdownConverter
+from src.pdf_converter import (
+    _HTML_CACHE_MAX_ENTRIES,
+    MarkdownToPDFConverter,
+    PDFToMarkdownConverter,
+    _build_stylesheet,
+    _paddle_ocr,
+)
+from tests.fixtures.mock_objects import StubConfig
+
+_OCR_CONFIG = MappingProxyType(
+    {
+        "processing.ocr": MappingProxyType(
+            {
+                "language": "eng",
+                "confidence_threshold": 60,
+            }
+        ),
+    }
+)
+
+_MD_PDF_CONFIG = MappingProxyType(
+    {
+        "processing.pdf": MappingProxyType(
+            {
+                "page_size": "A4",
+                "margins": [72, 72, 72, 72],
+                "font_family": "Times-Roman",
+                "font_size": 12,
+                "line_spacing": 1.2,
+            }
+        ),
+        "processing.markdown": MappingProxyType(
+            {
+                "extensions": ["tables", "fenced_code", "toc"],
+                "preserve_links": True,
+            }
+        ),
+        **_OCR_CONFIG,
+    }
+)
 
 
 class TestMarkdownToPDFConverter:
@@ -21,61 +61,47 @@ class TestMarkdownToPDFConverter:
     @pytest.fixture
     def mock_config(self):
         """Create a mock configuration."""
-        config = Mock(spec=Config)
-        config.get.side_effect = lambda key, default=None: {
-            "processing.pdf": {
-                "page_size": "A4",
-                "margins": [72, 72, 72, 72],
-                "font_family": "Times-Roman",
-                "font_size": 12,
-                "line_spacing": 1.2,
-            },
-            "processing.markdown": {
-                "extensions": ["tables", "fenced_code", "toc"],
-                "preserve_links": True,
-            },
-            "processing.ocr": {
-                "language": "eng",
-                "confidence_threshold": 60,
-            },
-        }.get(key, default)
-        config.get_pdf_config.return_value = {
-            "page_size": "A4",
-            "margins": [72, 72, 72, 72],
-            "font_family": "Times-Roman",
-            "font_size": 12,
-            "line_spacing": 1.2,
-        }
-        config.get_markdown_config.return_value = {
-            "extensions": ["tables", "fenced_code", "toc"],
-            "preserve_links": True,
-        }
-        return config
+        return StubConfig(_MD_PDF_CONFIG)
 
     @pytest.fixture
     def converter(self, mock_config):
         """Create a MarkdownToPDFConverter instance."""
         return MarkdownToPDFConverter(mock_config)
 
-    @pytest.fixture
-    def temp_markdown_file(self):
-        """Create a temporary markdown file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(
-                "# Test Document\n\nThis is a test document.\n\n## Section 1\n\nSome content here.\n"
-            )
-            temp_path = Path(f.name)
-
-        yield temp_path
-        temp_path.unlink(missing_ok=True)
+    @pytest.fixture(autouse=True)
+    def mock_markdown(self, monkeypatch):
+        """Stub out markdown rendering; returns the engine's convert method."""
+        engine_class = Mock()
+        render = engine_class.return_value.reset.return_value.convert
+        render.return_value = "<h1>Test Document</h1>"
+        monkeypatch.setattr("src.pdf_converter.markdown.Markdown", engine_class)
+        return render
+
+    @pytest.fixture(autouse=True)
+    def mock_html(self, monkeypatch):
+        """Stub out WeasyPrint so no real PDF is rendered."""
+        html = Mock()
+        html.return_value.write_pdf.return_value = b"PDF content"
+        monkeypatch.setattr("src.pdf_converter.weasyprint.HTML", html)
+        return html
+
+    @pytest.fixture(scope="module")
+    def temp_markdown_file(self, tmp_path_factory):
+        """Create a temporary markdown file shared by the tests in this module.
+
+        Tests only read it; conversions write their output alongside it.
+        """
+        path = tmp_path_factory.mktemp("md_to_pdf") / "sample.md"
+        path.write_text(
+            "# Test Document\n\nThis is a test document.\n\n## Section 1\n\nSome content here.\n"
+        )
+        return path
 
     def test_converter_initialization(self, mock_config):
         """Test converter initialization."""
         converter = MarkdownToPDFConverter(mock_config)
         assert converter.config == mock_config
 
-    @patch("src.pdf_converter.weasyprint.HTML")
-    @patch("src.pdf_converter.markdown.markdown")
     def test_convert_markdown_to_pdf_success(
         self, mock_markdown, mock_html, converter, temp_markdown_file
     ):
@@ -86,9 +112,7 @@ class TestMarkdownToPDFConverter:
         )
 
         # Mock HTML to PDF conversion
-        mock_html_instance = Mock()
-        mock_html.return_value = mock_html_instance
-        mock_html_instance.write_pdf.return_value = b"PDF content"
+        mock_html_instance = mock_html.return_value
 
         result = converter.convert_markdown_to_pdf(temp_markdown_file)
 
@@ -99,29 +123,46 @@ class TestMarkdownToPDFConverter:
         # Verify markdown was called
         mock_markdown.assert_called_once()
         mock_html.assert_called_once()
-        mock_html_instance.write_pdf.assert_called_once()
+        mock_html_instance.write_pdf.assert_called_once_with(
+            stylesheets=[converter._stylesheet],
+            font_config=converter._font_config,
+            cache=converter._image_cache,
+            optimize_images=True,
+        )
+
+    def test_image_cache_is_bounded(self, converter, temp_markdown_file):
+        """Test that the per-converter image cache is dropped once it grows large."""
+        converter._image_cache.update((f"img{i}", object()) for i in range(257))
+
+        converter.convert_markdown_to_pdf(temp_markdown_file)
+
+        assert converter._image_cache == {}
 
-    @patch("src.pdf_converter.weasyprint.HTML")
-    @patch("src.pdf_converter.markdown.markdown")
     def test_convert_markdown_to_pdf_with_custom_output(
-        self, mock_markdown, mock_html, converter, temp_markdown_file
+        self, converter, temp_markdown_file
     ):
         """Test markdown to PDF conversion with custom output path."""
         custom_output = temp_markdown_file.parent / "custom_output.pdf"
 
-        # Mock conversions
-        mock_markdown.return_value = "<h1>Test Document</h1>"
-        mock_html_instance = Mock()
-        mock_html.return_value = mock_html_instance
-        mock_html_instance.write_pdf.return_value = b"PDF content"
-
         result = converter.convert_markdown_to_pdf(temp_markdown_file, custom_output)
 
         assert result == custom_output
         assert result.exists()
 
-    @patch("src.pdf_converter.weasyprint.HTML")
-    @patch("src.pdf_converter.markdown.markdown")
+    def test_convert_markdown_to_pdf_large_input(
+        self, mock_markdown, converter, tmp_path
+    ):
+        """Test that a large file, read through a memory map, converts intact."""
+        content = "# Big Book\n\n" + "Ünïcode paragraph text.\n\n" * 100_000
+        markdown_file = tmp_path / "book.md"
+        markdown_file.write_text(content, encoding="utf-8")
+        assert markdown_file.stat().st_size > 1024 * 1024
+
+        result = converter.convert_markdown_to_pdf(markdown_file)
+
+        assert result.exists()
+        mock_markdown.assert_called_once_with(content)
+
     def test_convert_markdown_to_pdf_conversion_error(
         self, mock_markdown, mock_html, converter, temp_markdown_file
     ):
@@ -148,8 +189,6 @@ class TestMarkdownToPDFConverter:
         assert exc_info.value.severity == ErrorSeverity.HIGH
         assert "Input file does not exist" in str(exc_info.value)
 
-    @patch("src.pdf_converter.weasyprint.HTML")
-    @patch("src.pdf_converter.markdown.markdown")
     def test_convert_markdown_to_pdf_pdf_generation_error(
         self, mock_markdown, mock_html, converter, temp_markdown_file
     ):
@@ -158,8 +197,7 @@ class TestMarkdownToPDFConverter:
         mock_markdown.return_value = "<h1>Test Document</h1>"
 
         # Mock HTML instance with PDF generation error
-        mock_html_instance = Mock()
-        mock_html.return_value = mock_html_instance
+        mock_html_instance = mock_html.return_value
         mock_html_instance.write_pdf.side_effect = Exception("PDF generation failed")
 
         with pytest.raises(FileProcessingError) as exc_info:
@@ -168,6 +206,53 @@ class TestMarkdownToPDFConverter:
         assert exc_info.value.severity == ErrorSeverity.MEDIUM
         assert "Failed to generate PDF" in str(exc_info.value)
 
+    def test_process_markdown_reuses_rendered_html(self, mock_markdown, converter):
+        """Test that unchanged markdown is only rendered once."""
+        mock_markdown.side_effect = lambda text: f"<p>{text}</p>"
+
+        first = converter._process_markdown("# Note")
+        again = converter._process_markdown("# Note")
+        edited = converter._process_markdown("# Note, edited")
+
+        assert again == first
+        assert edited != first
+        assert mock_markdown.call_count == 2
+        # One engine, reset before each document
+        assert converter._md.reset.call_count == 2
+
+    def test_process_markdown_cache_is_bounded(self, mock_markdown, converter):
+        """Test that the rendered HTML cache evicts the least recently used."""
+        mock_markdown.side_effect = lambda text: f"<p>{text}</p>"
+
+        converter._process_markdown("note 0")
+        for i in range(1, _HTML_CACHE_MAX_ENTRIES + 1):
+            converter._process_markdown(f"note {i}")
+
+        assert len(converter._html_cache) == _HTML_CACHE_MAX_ENTRIES
+        assert "note 0" not in converter._html_cache
+
+    def test_stylesheet_is_parsed_once_per_page_layout(self, monkeypatch):
+        """Test that converters with the same page layout share one stylesheet."""
+        css = Mock(side_effect=lambda string: Mock(string=string))
+        monkeypatch.setattr("src.pdf_converter.weasyprint.CSS", css)
+        letter_config = MappingProxyType(
+            {
+                **_MD_PDF_CONFIG,
+                "processing.pdf": {"page_size": "letter", "margins": [36, 54, 36, 54]},
+            }
+        )
+        _build_stylesheet.cache_clear()
+
+        first = MarkdownToPDFConverter(StubConfig(_MD_PDF_CONFIG))
+        second = MarkdownToPDFConverter(StubConfig(_MD_PDF_CONFIG))
+        letter = MarkdownToPDFConverter(StubConfig(letter_config))
+        _build_stylesheet.cache_clear()
+
+        assert first._stylesheet is second._stylesheet
+        assert css.call_count == 2
+        assert "size: A4; margin: 72pt 72pt 72pt 72pt;" in first._stylesheet.string
+        assert "size: letter; margin: 36pt 54pt 36pt 54pt;" in letter._stylesheet.string
+
     def test_get_pdf_config(self, converter):
         """Test getting PDF configuration."""
         config = converter._get_pdf_config()
@@ -194,59 +279,62 @@ class TestPDFToMarkdownConverter:
     @pytest.fixture
     def mock_config(self):
         """Create a mock configuration."""
-        config = Mock(spec=Config)
-        config.get.side_effect = lambda key, default=None: {
-            "processing.ocr": {
-                "language": "eng",
-                "confidence_threshold": 60,
-            },
-        }.get(key, default)
-        config.get_ocr_config.return_value = {
-            "language": "eng",
-            "confidence_threshold": 60,
-        }
-        return config
+        return StubConfig(_OCR_CONFIG, get_ocr_config=_OCR_CONFIG["processing.ocr"])
 
     @pytest.fixture
     def converter(self, mock_config):
         """Create a PDFToMarkdownConverter instance."""
         return PDFToMarkdownConverter(mock_config)
 
-    @pytest.fixture
-    def temp_pdf_file(self):
-        """Create a temporary PDF file."""
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".pdf", delete=False) as f:
-            # Write a minimal PDF header
-            f.write(b"%PDF-1.4\n")
-            f.write(b"1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n")
-            f.write(b"2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n")
-            f.write(
-                b"3 0 obj\n<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n>>\nendobj\n"
-            )
-            f.write(
-                b"xref\n0 4\n0000000000 65535 f \n0000000009 00000 n \n0000000058 00000 n \n0000000115 00000 n \n"
-            )
-            f.write(b"trailer\n<<\n/Size 4\n/Root 1 0 R\n>>\nstartxref\n174\n%%EOF\n")
-            temp_path = Path(f.name)
-
-        yield temp_path
-        temp_path.unlink(missing_ok=True)
+    @pytest.fixture(autouse=True)
+    def mock_pdf_open(self, monkeypatch):
+        """Stub out pdfplumber; by default the PDF has no text layer."""
+        pdf_open = MagicMock()
+        pdf_open.return_value.__enter__.return_value.pages = []
+        monkeypatch.setattr("pdfplumber.open", pdf_open)
+        return pdf_open
+
+    @pytest.fixture(autouse=True)
+    def mock_convert(self, monkeypatch):
+        """Stub out rasterizing, yielding a single page."""
+        convert = Mock(return_value=[Mock()])
+        monkeypatch.setattr("pdf2image.convert_from_path", convert)
+        return convert
+
+    @pytest.fixture(autouse=True)
+    def mock_ocr(self, monkeypatch):
+        """Stub out tesseract."""
+        ocr = Mock(return_value="Test Document\n\nThis is a test document.")
+        monkeypatch.setattr("pytesseract.image_to_string", ocr)
+        return ocr
+
+    @pytest.fixture(scope="module")
+    def temp_pdf_file(self, tmp_path_factory):
+        """Create a temporary PDF file shared by the tests in this module.
+
+        Tests only read it; conversions write their output alongside it.
+        """
+        path = tmp_path_factory.mktemp("pdf_to_md") / "sample.pdf"
+        # Write a minimal PDF
+        path.write_bytes(
+            b"%PDF-1.4\n"
+            b"1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n"
+            b"2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n"
+            b"3 0 obj\n<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n>>\nendobj\n"
+            b"xref\n0 4\n0000000000 65535 f \n0000000009 00000 n \n0000000058 00000 n \n0000000115 00000 n \n"
+            b"trailer\n<<\n/Size 4\n/Root 1 0 R\n>>\nstartxref\n174\n%%EOF\n"
+        )
+        return path
 
     def test_converter_initialization(self, mock_config):
         """Test converter initialization."""
         converter = PDFToMarkdownConverter(mock_config)
         assert converter.config == mock_config
 
-    @patch("pdf2image.convert_from_path")
-    @patch("pytesseract.image_to_string")
     def test_convert_pdf_to_markdown_success(
         self, mock_ocr, mock_convert, converter, temp_pdf_file
     ):
         """Test successful PDF to markdown conversion."""
-        # Mock PDF to image conversion
-        mock_image = Mock()
-        mock_convert.return_value = [mock_image]
-
         # Mock OCR
         mock_ocr.return_value = "Test Document\n\nThis is a test document.\n\nSection 1\n\nSome content here."
 
@@ -256,21 +344,18 @@ class TestPDFToMarkdownConverter:
         assert result.suffix == ".md"
         assert result.exists()
 
-        # Verify OCR was called
+        # Verify OCR was called on page files rather than in-memory images
         mock_convert.assert_called_once()
+        assert mock_convert.call_args.kwargs["paths_only"] is True
+        assert mock_convert.call_args.kwargs["output_folder"]
         mock_ocr.assert_called_once()
 
-    @patch("pdf2image.convert_from_path")
-    @patch("pytesseract.image_to_string")
     def test_convert_pdf_to_markdown_with_custom_output(
-        self, mock_ocr, mock_convert, converter, temp_pdf_file
+        self, mock_ocr, converter, temp_pdf_file
     ):
         """Test PDF to markdown conversion with custom output path."""
         custom_output = temp_pdf_file.parent / "custom_output.md"
 
-        # Mock conversions
-        mock_image = Mock()
-        mock_convert.return_value = [mock_image]
         mock_ocr.return_value = "Test Document\n\nThis is a test document."
 
         result = converter.convert_pdf_to_markdown(temp_pdf_file, custom_output)
@@ -278,7 +363,106 @@ class TestPDFToMarkdownConverter:
         assert result == custom_output
         assert result.exists()
 
-    @patch("pdf2image.convert_from_path")
+    def test_convert_pdf_to_markdown_multiple_pages(
+        self, monkeypatch, mock_ocr, mock_convert, converter, temp_pdf_file, tmp_path
+    ):
+        """Test that pages are OCR'd in one batch per core and keep their order."""
+        monkeypatch.setattr("src.pdf_converter.os.cpu_count", lambda: 2)
+        mock_convert.return_value = [str(tmp_path / f"page{i}.png") for i in range(3)]
+
+        def ocr(source, **kwargs):
+            # A batch arrives as a list file; tesseract ends each page with \f
+            path = Path(source)
+            names = path.read_text().split() if path.suffix == ".txt" else [source]
+            return "".join(f"{Path(name).stem} text.\f" for name in names)
+
+        mock_ocr.side_effect = ocr
+
+        result = converter.convert_pdf_to_markdown(temp_pdf_file)
+
+        assert mock_ocr.call_count == 2
+        content = result.read_text()
+        assert content.index("page0") < content.index("page1") < content.index("page2")
+
+    @pytest.mark.parametrize(
+        "cpus, limit_during_ocr", [(2, "1"), (1, None)], ids=["parallel", "serial"]
+    )
+    def test_omp_thread_limit_is_scoped_to_parallel_ocr(
+        self,
+        monkeypatch,
+        mock_ocr,
+        mock_convert,
+        converter,
+        temp_pdf_file,
+        tmp_path,
+        cpus,
+        limit_during_ocr,
+    ):
+        """Test that OpenMP is limited only while batches run in parallel."""
+        monkeypatch.setattr("src.pdf_converter.os.cpu_count", lambda: cpus)
+        monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+        mock_convert.return_value = [str(tmp_path / f"page{i}.png") for i in range(2)]
+        seen = []
+
+        def ocr(source, **kwargs):
+            seen.append(os.environ.get("OMP_THREAD_LIMIT"))
+            return "Page text.\f" * (2 if source.endswith(".txt") else 1)
+
+        mock_ocr.side_effect = ocr
+
+        converter.convert_pdf_to_markdown(temp_pdf_file)
+
+        assert seen and set(seen) == {limit_during_ocr}
+        assert "OMP_THREAD_LIMIT" not in os.environ
+
+    def test_convert_pdf_to_markdown_batch_page_count_mismatch(
+        self, monkeypatch, mock_ocr, mock_convert, converter, temp_pdf_file, tmp_path
+    ):
+        """Test that a batch missing page breaks in the output is an OCR error."""
+        monkeypatch.setattr("src.pdf_converter.os.cpu_count", lambda: 1)
+        mock_convert.return_value = [str(tmp_path / f"page{i}.png") for i in range(2)]
+        mock_ocr.return_value = "Only one page of text."
+
+        with pytest.raises(FileProcessingError) as exc_info:
+            converter.convert_pdf_to_markdown(temp_pdf_file)
+
+        assert exc_info.value.severity == ErrorSeverity.MEDIUM
+        assert "tesseract returned 1 pages for 2 images" in str(exc_info.value)
+
+    def test_convert_pdf_to_markdown_digital_text_fast_path(
+        self, mock_pdf_open, mock_ocr, mock_convert, converter, temp_pdf_file
+    ):
+        """Test that an embedded text layer is used without rasterizing or OCR."""
+        page = Mock()
+        page.extract_text.return_value = "This page has a real embedded text layer."
+        mock_pdf_open.return_value.__enter__.return_value.pages = [page]
+
+        result = converter.convert_pdf_to_markdown(temp_pdf_file)
+
+        assert "real embedded text layer" in result.read_text()
+        mock_convert.assert_not_called()
+        mock_ocr.assert_not_called()
+
+    def test_convert_pdf_to_markdown_ocrs_only_pages_without_text(
+        self, mock_pdf_open, mock_ocr, mock_convert, converter, temp_pdf_file
+    ):
+        """Test that only pages lacking a text layer are sent to OCR."""
+        digital, scanned = Mock(), Mock()
+        digital.extract_text.return_value = "This page has a real embedded text layer."
+        scanned.extract_text.return_value = ""
+        mock_pdf_open.return_value.__enter__.return_value.pages = [digital, scanned]
+        images = [Mock(), Mock()]
+        mock_convert.return_value = images
+        mock_ocr.return_value = "Scanned page text."
+
+        result = converter.convert_pdf_to_markdown(temp_pdf_file)
+
+        mock_ocr.assert_called_once()
+        assert mock_ocr.call_args.args[0] is images[1]
+        content = result.read_text()
+        assert "real embedded text layer" in content
+        assert "Scanned page text" in content
+
     def test_convert_pdf_to_markdown_conversion_error(
         self, mock_convert, converter, temp_pdf_file
     ):
@@ -302,16 +486,10 @@ class TestPDFToMarkdownConverter:
         assert exc_info.value.severity == ErrorSeverity.HIGH
         assert "Input file does not exist" in str(exc_info.value)
 
-    @patch("pdf2image.convert_from_path")
-    @patch("pytesseract.image_to_string")
     def test_convert_pdf_to_markdown_ocr_error(
-        self, mock_ocr, mock_convert, converter, temp_pdf_file
+        self, mock_ocr, converter, temp_pdf_file
     ):
         """Test PDF to markdown conversion with OCR error."""
-        # Mock PDF to image conversion
-        mock_image = Mock()
-        mock_convert.return_value = [mock_image]
-
         # Mock OCR error
         mock_ocr.side_effect = Exception("OCR failed")
 
@@ -321,6 +499,81 @@ class TestPDFToMarkdownConverter:
         assert exc_info.value.severity == ErrorSeverity.MEDIUM
         assert "Failed to extract text from PDF" in str(exc_info.value)
 
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("INTRODUCTION", "# INTRODUCTION"),
+            ("SECTION 2: RESULTS", "# SECTION 2: RESULTS"),
+            ("Getting started", "## Getting started"),
+            ("A short sentence.", "A short sentence."),
+            ("x" * 50, "x" * 50),
+            ("   ", ""),
+        ],
+        ids=["caps", "caps_with_digits", "short", "sentence", "long", "blank"],
+    )
+    def test_process_extracted_text(self, converter, line, expected):
+        """Test heading detection on OCR'd lines."""
+        assert converter._process_extracted_text(f"{line}\n") == f"{expected}\n"
+
+    @pytest.fixture
+    def paddle_class(self, monkeypatch):
+        """Install a stub paddleocr module and drop any cached model after."""
+        paddle_class = Mock()
+        monkeypatch.setitem(
+            sys.modules, "paddleocr", SimpleNamespace(PaddleOCR=paddle_class)
+        )
+        _paddle_ocr.cache_clear()
+        yield paddle_class
+        _paddle_ocr.cache_clear()
+
+    @pytest.mark.parametrize(
+        "detected, expected",
+        [
+            (
+                [
+                    [[[0, 0], [1, 1]], ("First line", 0.98)],
+                    [[[0, 2], [1, 3]], ("Second", 0.9)],
+                ],
+                "First line\nSecond",
+            ),
+            (None, ""),
+        ],
+        ids=["lines", "nothing_detected"],
+    )
+    def test_convert_pdf_to_markdown_paddle_backend(
+        self, paddle_class, mock_ocr, temp_pdf_file, detected, expected
+    ):
+        """Test that the paddle engine is loaded once and its lines joined."""
+        paddle_class.return_value.ocr.return_value = [detected]
+        ocr_config = {**_OCR_CONFIG["processing.ocr"], "engine": "paddle"}
+        converter = PDFToMarkdownConverter(
+            StubConfig(_OCR_CONFIG, get_ocr_config=ocr_config)
+        )
+
+        with patch.object(converter, "_process_extracted_text", side_effect=str):
+            converter.convert_pdf_to_markdown(temp_pdf_file)
+            result = converter.convert_pdf_to_markdown(temp_pdf_file)
+
+        paddle_class.assert_called_once_with(
+            use_angle_cls=False, lang="en", show_log=False
+        )
+        assert paddle_class.return_value.ocr.call_count == 2
+        assert result.read_text() == f"{expected}\n\n"
+        mock_ocr.assert_not_called()
+
+    def test_convert_pdf_to_markdown_unknown_engine(self, temp_pdf_file):
+        """Test that an unknown OCR engine is reported as a configuration error."""
+        ocr_config = {**_OCR_CONFIG["processing.ocr"], "engine": "nope"}
+        converter = PDFToMarkdownConverter(
+            StubConfig(_OCR_CONFIG, get_ocr_config=ocr_config)
+        )
+
+        with pytest.raises(FileProcessingError) as exc_info:
+            converter.convert_pdf_to_markdown(temp_pdf_file)
+
+        assert exc_info.value.severity == ErrorSeverity.HIGH
+        assert "Unsupported OCR engine: nope" in str(exc_info.value)
+
     def test_get_ocr_config(self, converter):
         """Test getting OCR configuration."""
         config = converter._get_ocr_config()
@@ -328,16 +581,10 @@ class TestPDFToMarkdownConverter:
         assert config["language"] == "eng"
         assert config["confidence_threshold"] == 60
 
-    @patch("pdf2image.convert_from_path")
-    @patch("pytesseract.image_to_string")
     def test_convert_pdf_to_markdown_empty_text(
-        self, mock_ocr, mock_convert, converter, temp_pdf_file
+        self, mock_ocr, converter, temp_pdf_file
     ):
         """Test PDF to markdown conversion with empty OCR result."""
-        # Mock PDF to image conversion
-        mock_image = Mock()
-        mock_convert.return_value = [mock_image]
-
         # Mock empty OCR result
         mock_ocr.return_value = ""
 